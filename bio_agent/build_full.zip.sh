@@ -25,7 +25,7 @@ build_for() {
     -v "$(pwd)/$BUILD_DIR:/var/task" \
     -w /var/task \
     public.ecr.aws/lambda/python:3.11 \
-    pip install h3 psycopg2-binary boto3 -t . --no-cache-dir
+    pip install h3 psycopg2-binary boto3 orjson -t . --no-cache-dir
 
   echo "3. Tworzenie zip..."
   cd "$BUILD_DIR"
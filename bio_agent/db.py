@@ -4,33 +4,60 @@ Supports env vars (PGHOST, PGPORT, PGDATABASE, PGUSER, PGPASSWORD) or Secrets Ma
 """
 from __future__ import annotations
 
+import atexit
 import json
 import logging
 import os
+import threading
+import time
+import weakref
 from contextlib import contextmanager
-from typing import Any, Generator
+from typing import Any, Generator, Sequence
+
+try:
+    import psycopg2
+    import psycopg2.pool
+except ImportError:  # pragma: no cover - bundled in the Lambda package
+    psycopg2 = None
+try:
+    import boto3
+except ImportError:  # only needed when SECRET_ARN is set
+    boto3 = None
 
 logger = logging.getLogger(__name__)
 
 _SCHEMA = os.environ.get("PG_SCHEMA", "serving")
 
+# Secrets Manager client + decoded secret, cached across warm invocations.
+# TTL keeps rotated credentials from going stale for too long.
+_SECRET_TTL_S = int(os.environ.get("SECRET_CACHE_TTL", "900"))
+_SM_CLIENT: Any = None
+_SECRET_CACHE: tuple[float, dict[str, Any]] | None = None
+
 
 def _get_credentials() -> dict[str, Any]:
     """Resolve DB credentials from env or Secrets Manager."""
+    global _SM_CLIENT, _SECRET_CACHE
     secret_arn = os.environ.get("SECRET_ARN")
     if secret_arn:
+        if _SECRET_CACHE and time.time() - _SECRET_CACHE[0] < _SECRET_TTL_S:
+            return _SECRET_CACHE[1]
         try:
-            import boto3
-            client = boto3.client("secretsmanager")
-            resp = client.get_secret_value(SecretId=secret_arn)
+            if _SM_CLIENT is None:
+                if boto3 is None:
+                    raise ImportError("boto3 is required when SECRET_ARN is set")
+                _SM_CLIENT = boto3.client("secretsmanager")
+            resp = _SM_CLIENT.get_secret_value(SecretId=secret_arn)
             secret = json.loads(resp.get("SecretString", "{}"))
-            return {
+            creds = {
                 "host": secret.get("host"),
                 "port": int(secret.get("port", 5432)),
                 "dbname": secret.get("dbname"),
                 "user": secret.get("username") or secret.get("user"),
                 "password": secret.get("password"),
             }
+            _SECRET_CACHE = (time.time(), creds)
+            return creds
         except Exception as e:
             logger.exception("Failed to fetch secret: %s", e)
             raise
@@ -44,26 +71,86 @@ def _get_credentials() -> dict[str, Any]:
     }
 
 
-@contextmanager
-def get_connection() -> Generator[Any, None, None]:
-    """Yield a psycopg2 connection. Closes on exit."""
-    import psycopg2
+_POOL_MIN = int(os.environ.get("PG_POOL_MIN", "2"))
+_POOL_MAX = int(os.environ.get("PG_POOL_MAX", "16"))
+_POOL: Any = None
+_POOL_LOCK = threading.Lock()
+# Names of statements PREPAREd on each pooled connection (dropped with the connection)
+_PREPARED: weakref.WeakKeyDictionary[Any, set[str]] = weakref.WeakKeyDictionary()
+
+
+def _open_pool() -> Any:
+    """Create a ThreadedConnectionPool with TCP keepalives for warm-container reuse."""
+    if psycopg2 is None:
+        raise ImportError("psycopg2 is required (pip install psycopg2-binary)")
     creds = _get_credentials()
     if not all([creds.get("host"), creds.get("dbname"), creds.get("user"), creds.get("password")]):
         raise ValueError("Missing DB credentials. Set PGHOST, PGDATABASE, PGUSER, PGPASSWORD or SECRET_ARN")
-    conn = psycopg2.connect(
-        host=creds["host"],
-        port=creds["port"],
-        dbname=creds["dbname"],
-        user=creds["user"],
-        password=creds["password"],
-        connect_timeout=10,
-    )
+    global _SECRET_CACHE
+    try:
+        return psycopg2.pool.ThreadedConnectionPool(
+            _POOL_MIN,
+            _POOL_MAX,
+            host=creds["host"],
+            port=creds["port"],
+            dbname=creds["dbname"],
+            user=creds["user"],
+            password=creds["password"],
+            connect_timeout=10,
+            keepalives=1,
+            keepalives_idle=30,
+            keepalives_interval=10,
+            keepalives_count=3,
+        )
+    except psycopg2.OperationalError:
+        # Credentials may have been rotated: force a Secrets Manager refetch next time
+        _SECRET_CACHE = None
+        raise
+
+
+def _get_pool() -> Any:
+    global _POOL
+    if _POOL is None or _POOL.closed:
+        with _POOL_LOCK:
+            if _POOL is None or _POOL.closed:
+                _POOL = _open_pool()
+    return _POOL
+
+
+@atexit.register
+def _close_pool() -> None:
+    if _POOL is not None and not _POOL.closed:
+        _POOL.closeall()
+
+
+@contextmanager
+def get_connection() -> Generator[Any, None, None]:
+    """
+    Yield a pooled psycopg2 connection; closed connections are discarded and replaced.
+    Commits on success, rolls back on error, and returns the connection to the pool.
+
+    There is no per-borrow probe query: TCP keepalives detect dead peers, and a
+    connection that fails mid-query is marked closed by psycopg2 and dropped below.
+    """
+    pool = _get_pool()
+    conn = pool.getconn()
+    if conn.closed:
+        pool.putconn(conn, close=True)
+        conn = pool.getconn()
     conn.autocommit = False
+    broken = False
     try:
         yield conn
+        conn.commit()
+    except Exception:
+        try:
+            conn.rollback()
+        except Exception:
+            logger.warning("Rollback failed; discarding pooled connection")
+            broken = True
+        raise
     finally:
-        conn.close()
+        pool.putconn(conn, close=broken or bool(conn.closed))
 
 
 def schema() -> str:
@@ -75,3 +162,26 @@ def _row_to_dict(cursor, row: tuple) -> dict:
     if row is None:
         return {}
     return dict(zip([d[0] for d in cursor.description], row))
+
+
+def execute_prepared(cursor, name: str, sql: str, args: Sequence[Any]) -> None:
+    """
+    Execute sql as a server-side prepared statement, issuing PREPARE once per connection.
+    sql must use $1..$n placeholders; args are bound positionally via EXECUTE.
+    """
+    prepared = _PREPARED.setdefault(cursor.connection, set())
+    if name not in prepared:
+        cursor.execute(f"PREPARE {name} AS {sql}")
+        prepared.add(name)
+    if args:
+        cursor.execute(f"EXECUTE {name} ({', '.join(['%s'] * len(args))})", list(args))
+    else:
+        cursor.execute(f"EXECUTE {name}")
+
+
+# Open the pool during Lambda init so the first request does not pay the handshake
+if os.environ.get("AWS_LAMBDA_FUNCTION_NAME"):
+    try:
+        _get_pool()
+    except Exception as e:
+        logger.warning("Eager DB pool init failed, will retry lazily: %s", e)
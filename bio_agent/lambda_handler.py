@@ -4,10 +4,13 @@ Supports both OpenAPI schema (apiPath) and function-details (function) invocatio
 """
 from __future__ import annotations
 
-import json
 import logging
+from decimal import Decimal
 from typing import Any
 
+import orjson
+
+import db
 from tools.get_hex_metrics import handler as get_hex_metrics
 from tools.get_neighbor_hexes import handler as get_neighbor_hexes
 from tools.get_neighbor_summary import handler as get_neighbor_summary
@@ -16,6 +19,7 @@ from tools.get_osm_context import handler as get_osm_context
 from tools.get_terrain_cover import handler as get_terrain_cover
 from tools.get_info_about_threatened_species import handler as get_info_about_threatened_species
 from tools.get_species_profiles import handler as get_species_profiles
+from tools.params import parse as _params_to_dict
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -23,34 +27,36 @@ logger = logging.getLogger(__name__)
 # Quick-action fallback: Bedrock sometimes sends action_group_quick_action1
 QUICK_ACTION_NAMES = ("action_group_quick_action1", "action_group_quick_action", "quick_action")
 
-# Map apiPath or function name to handler
+# Map apiPath or function name to handler, keyed by slash-stripped lowercase name
 TOOL_HANDLERS = {
-    "GetHexMetrics": get_hex_metrics,
-    "getHexMetrics": get_hex_metrics,
-    "/getHexMetrics": get_hex_metrics,
-    "GetNeighborHexes": get_neighbor_hexes,
-    "getNeighborHexes": get_neighbor_hexes,
-    "/getNeighborHexes": get_neighbor_hexes,
-    "GetNeighborSummary": get_neighbor_summary,
-    "getNeighborSummary": get_neighbor_summary,
-    "/getNeighborSummary": get_neighbor_summary,
-    "GetHexSpeciesContext": get_hex_species_context,
-    "getHexSpeciesContext": get_hex_species_context,
-    "/getHexSpeciesContext": get_hex_species_context,
-    "GetOSMContext": get_osm_context,
-    "getOSMContext": get_osm_context,
-    "/getOSMContext": get_osm_context,
-    "GetTerrainCover": get_terrain_cover,
-    "getTerrainCover": get_terrain_cover,
-    "/getTerrainCover": get_terrain_cover,
-    "GetInfoAboutThreatenedSpecies": get_info_about_threatened_species,
-    "getInfoAboutThreatenedSpecies": get_info_about_threatened_species,
-    "/getInfoAboutThreatenedSpecies": get_info_about_threatened_species,
-    "GetSpeciesProfiles": get_species_profiles,
-    "getSpeciesProfiles": get_species_profiles,
-    "/getSpeciesProfiles": get_species_profiles,
+    "gethexmetrics": get_hex_metrics,
+    "getneighborhexes": get_neighbor_hexes,
+    "getneighborsummary": get_neighbor_summary,
+    "gethexspeciescontext": get_hex_species_context,
+    "getosmcontext": get_osm_context,
+    "getterraincover": get_terrain_cover,
+    "getinfoaboutthreatenedspecies": get_info_about_threatened_species,
+    "getspeciesprofiles": get_species_profiles,
 }
 
+def _json_default(o: Any) -> str | None:
+    """
+    Fallback for types orjson does not serialize natively (e.g. Decimal).
+    Float NaN is already emitted as null by orjson; NUMERIC 'NaN' (Decimal) is mapped here.
+    """
+    if isinstance(o, Decimal) and o.is_nan():
+        return None
+    return str(o)
+
+
+def _dumps(body: Any) -> str:
+    """Serialize a tool result in one C-level pass. NaN/Inf become null, datetimes ISO 8601."""
+    return orjson.dumps(
+        body,
+        default=_json_default,
+        option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+    ).decode()
+
 
 def _extract_params(event: dict) -> tuple[list[dict], dict | None]:
     """Extract parameters from OpenAPI or function-details event."""
@@ -59,43 +65,25 @@ def _extract_params(event: dict) -> tuple[list[dict], dict | None]:
     return params, body
 
 
-def _params_to_dict(params: list[dict], body: dict | None) -> dict[str, Any]:
-    """Build flat dict of param name -> value from params and body."""
-    p: dict[str, Any] = {}
-    for x in (params or []):
-        if isinstance(x, dict) and x.get("name"):
-            p[x["name"]] = x.get("value")
-    if body and isinstance(body, dict):
-        props = body.get("content", {}).get("application/json", {}).get("properties", [])
-        if isinstance(props, list):
-            for x in props:
-                if isinstance(x, dict) and x.get("name"):
-                    p[x["name"]] = x.get("value", p.get(x["name"]))
-        elif isinstance(props, dict):
-            p.update(props)
-    return p
-
-
 def _infer_tool_from_params(params: list[dict], body: dict | None) -> str | None:
     """Infer tool name when Bedrock sends action_group_quick_action1."""
-    p = _params_to_dict(params, body)
-    h3_ids = p.get("h3_ids") or p.get("h3Ids")
-    k_ring = p.get("k_ring") or p.get("kRing")
-    species_ids = p.get("species_ids") or p.get("speciesIds")
-    species_names = p.get("species_names") or p.get("speciesNames")
-    species_ids_or_names = p.get("species_ids_or_names") or p.get("speciesIdsOrNames")
-    h3_id = p.get("h3_id") or p.get("h3Id")
-    h3_res = p.get("h3_res") or p.get("h3Res")
-
-    if h3_ids is not None:
+    # One pass: snake_case and camelCase names collapse to the same key (h3_ids / h3Ids -> h3ids).
+    # Values are folded with `or`, as the per-name lookups were, and tested for truthiness:
+    # empty values ("" or []) count as absent, and no valid k_ring / h3_res is 0.
+    p: dict[str, Any] = {}
+    for k, v in _params_to_dict(params, body).items():
+        key = k.lower().replace("_", "")
+        p[key] = p.get(key) or v
+
+    if p.get("h3ids"):
         return "GetNeighborSummary"
-    if k_ring is not None:
+    if p.get("kring"):
         return "GetNeighborHexes"
-    if species_ids or species_names:
+    if p.get("speciesids") or p.get("speciesnames"):
         return "GetSpeciesProfiles"
-    if species_ids_or_names:
+    if p.get("speciesidsornames"):
         return "GetInfoAboutThreatenedSpecies"
-    if h3_id and h3_res is not None:
+    if p.get("h3id") and p.get("h3res"):
         return "GetHexMetrics"
     return None
 
@@ -111,7 +99,7 @@ def _build_openapi_response(event: dict, body: dict, status: int = 200) -> dict:
             "httpStatusCode": status,
             "responseBody": {
                 "application/json": {
-                    "body": json.dumps(body),
+                    "body": _dumps(body),
                 },
             },
         },
@@ -125,7 +113,7 @@ def _build_function_response(event: dict, body: dict, state: str = "SUCCESS") ->
     func_resp: dict[str, Any] = {
         "responseBody": {
             "TEXT": {
-                "body": json.dumps(body),
+                "body": _dumps(body),
             },
         },
     }
@@ -143,11 +131,28 @@ def _build_function_response(event: dict, body: dict, state: str = "SUCCESS") ->
     }
 
 
+def _response_body_size(resp: dict) -> int:
+    """Size of the already-serialized tool body (the bulk of the payload), without re-encoding."""
+    r = resp["response"]
+    if "functionResponse" in r:
+        return len(r["functionResponse"]["responseBody"]["TEXT"]["body"])
+    return len(r["responseBody"]["application/json"]["body"])
+
+
 def lambda_handler(event: dict, context: Any) -> dict:
     """
     Main Lambda entry point for Bedrock Agent action group.
     Routes to the appropriate tool handler based on apiPath or function.
     """
+    # Scheduled keep-warm ping: re-validate the cached DB connection and return immediately
+    if event.get("source") == "serverless-plugin-warmup" or event.get("warmer") is True:
+        try:
+            with db.get_connection():
+                pass
+        except Exception as e:
+            logger.warning("Warmup DB check failed: %s", e)
+        return {"warmed": True}
+
     logger.info(
         "Bedrock invocation: apiPath=%s function=%s actionGroup=%s keys=%s",
         event.get("apiPath"),
@@ -157,9 +162,7 @@ def lambda_handler(event: dict, context: Any) -> dict:
     )
     try:
         # Determine tool: OpenAPI uses apiPath, function-details uses function
-        api_path = event.get("apiPath", "").strip("/") or event.get("apiPath")
-        func_name = event.get("function", "")
-        tool_key = api_path or func_name
+        tool_key = (event.get("apiPath") or event.get("function") or "").strip("/").lower()
 
         if not tool_key:
             logger.error("Missing apiPath and function in event")
@@ -174,7 +177,7 @@ def lambda_handler(event: dict, context: Any) -> dict:
         if tool_key in QUICK_ACTION_NAMES:
             inferred = _infer_tool_from_params(params, body)
             if inferred:
-                tool_key = inferred
+                tool_key = inferred.lower()
                 logger.info("Inferred tool from params: %s", tool_key)
             else:
                 logger.error("Quick action but could not infer tool from params")
@@ -183,7 +186,7 @@ def lambda_handler(event: dict, context: Any) -> dict:
                     return _build_function_response(event, err_body, "FAILURE")
                 return _build_openapi_response(event, err_body, 404)
 
-        handler_fn = TOOL_HANDLERS.get(tool_key) or TOOL_HANDLERS.get("/" + tool_key)
+        handler_fn = TOOL_HANDLERS.get(tool_key)
         if not handler_fn:
             logger.error("Unknown tool: %s", tool_key)
             err_body = {"error": "Unknown tool", "tool": tool_key}
@@ -198,10 +201,10 @@ def lambda_handler(event: dict, context: Any) -> dict:
             resp = _build_function_response(event, result)
         else:
             resp = _build_openapi_response(event, result)
-        resp_size = len(json.dumps(resp))
-        logger.info("Response size: %d bytes", resp_size)
+        resp_size = _response_body_size(resp)
+        logger.info("Response body size: %d chars", resp_size)
         if resp_size > 5_000_000:
-            logger.warning("Response very large (%d bytes), may exceed Lambda limit", resp_size)
+            logger.warning("Response very large (%d chars), may exceed Lambda limit", resp_size)
         return resp
 
     except ValueError as e:
@@ -5,27 +5,33 @@ from __future__ import annotations
 
 import json
 import logging
-from datetime import datetime
+from datetime import date, datetime
 from typing import Any
 
+import psycopg2.extras
+
 import db
+from .params import parse as _parse_params
 from .validation import validate_h3_id, validate_h3_resolution, validate_year, validate_last_n_months
 
 logger = logging.getLogger(__name__)
 SCHEMA = db.schema()
 
-
-def _parse_params(params: list[dict], body: dict | None) -> dict[str, Any]:
-    p = {x["name"]: x.get("value") for x in params if x.get("name")}
-    if body and isinstance(body, dict):
-        props = body.get("content", {}).get("application/json", {}).get("properties", [])
-        if isinstance(props, list):
-            for x in props:
-                if isinstance(x, dict) and x.get("name"):
-                    p[x["name"]] = x.get("value", p.get(x["name"]))
-        elif isinstance(props, dict):
-            p.update(props)
-    return p
+# Columns returned to the agent (trend uses richness, threatened and dqi).
+# The diversity indices are written by the gold ETL as mixed-case (quoted) identifiers;
+# they are aliased to the lowercase keys the agent schema documents.
+METRIC_COLUMNS = (
+    "h3_index, h3_resolution, country, year, observation_count, species_richness_cell, "
+    "n_threatened_species, threat_score_weighted, dqi, "
+    '"shannon_H" AS shannon_h, "simpson_1_minus_D" AS simpson_1_minus_d'
+)
+HEX_METRICS_SQL = f"""
+    SELECT {METRIC_COLUMNS}
+    FROM {SCHEMA}.gbif_cell_metrics
+    WHERE h3_index = $1 AND h3_resolution = $2
+      AND ($3::int IS NULL OR year BETWEEN $3 AND $4::int)
+    ORDER BY year
+"""
 
 
 def _get_year_filter(params: dict) -> tuple[int | None, int | None]:
@@ -39,7 +45,6 @@ def _get_year_filter(params: dict) -> tuple[int | None, int | None]:
             n = int(last_n)
             if n <= 0:
                 return None, None
-            from datetime import date
             end_year = date.today().year
             start_year = end_year - (n // 12) - 1
             return max(2000, start_year), end_year
@@ -68,25 +73,6 @@ def handler(params: list[dict], body: dict | None = None) -> dict[str, Any]:
     year_start, year_end = _get_year_filter(p)
 
     with db.get_connection() as conn:
-        cur = conn.cursor()
-
-        year_clause = ""
-        args: list[Any] = [h3_id, h3_res]
-        if year_start is not None and year_end is not None:
-            year_clause = " AND year BETWEEN %s AND %s"
-            args.extend([year_start, year_end])
-
-        q = f"""
-            SELECT *
-            FROM {SCHEMA}.gbif_cell_metrics
-            WHERE h3_index = %s AND h3_resolution = %s
-            """ + year_clause + """
-            ORDER BY year
-        """
-        cur.execute(q, args)
-        rows = cur.fetchall()
-        cols = [d[0] for d in cur.description]
-
         result: dict[str, Any] = {
             "h3_id": h3_id,
             "h3_resolution": h3_res,
@@ -94,18 +80,10 @@ def handler(params: list[dict], body: dict | None = None) -> dict[str, Any]:
             "trend": None,
         }
 
-        def _to_json_val(v):
-            if v is None:
-                return None
-            if isinstance(v, float) and v != v:
-                return None
-            if isinstance(v, (int, str, bool, float)):
-                return v
-            return str(v)
-
-        for row in rows:
-            r = dict(zip(cols, row))
-            result["metrics"].append({k: _to_json_val(v) for k, v in r.items()})
+        # One row per year, so a client-side cursor is fine (DECLARE cannot wrap EXECUTE)
+        with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cur:
+            db.execute_prepared(cur, "hex_metrics_q", HEX_METRICS_SQL, [h3_id, h3_res, year_start, year_end])
+            result["metrics"] = cur.fetchall()
 
         if len(result["metrics"]) >= 2:
             first = result["metrics"][0]
@@ -116,5 +94,4 @@ def handler(params: list[dict], body: dict | None = None) -> dict[str, Any]:
                 "dqi_change": round(float(last.get("dqi") or 0) - float(first.get("dqi") or 0), 4),
             }
 
-        cur.close()
         return result
@@ -7,22 +7,40 @@ import json
 import logging
 from typing import Any
 
+import psycopg2.extras
+
 import db
+from .params import parse as _parse_params
 from .validation import validate_h3_id, validate_h3_resolution, validate_year
 
 logger = logging.getLogger(__name__)
 SCHEMA = db.schema()
 
-
-def _parse_params(params: list[dict], body: dict | None) -> dict[str, Any]:
-    p = {x["name"]: x.get("value") for x in (params or []) if x.get("name")}
-    if body and isinstance(body, dict):
-        props = body.get("content", {}).get("application/json", {}).get("properties", [])
-        if isinstance(props, list):
-            for x in props:
-                if isinstance(x, dict) and x.get("name"):
-                    p[x["name"]] = x.get("value", p.get(x["name"]))
-    return p
+# Year resolution (explicit year -> latest for hex -> latest overall), the species join and
+# per-taxon dedup (highest occurrence_count wins) in one round-trip.
+# LEFT JOIN from y keeps the resolved year when the hex is empty.
+SPECIES_CONTEXT_SQL = f"""
+    WITH y AS (
+        SELECT COALESCE(
+            %(year)s::int,
+            (SELECT MAX(year) FROM {SCHEMA}.gbif_species_h3_mapping WHERE h3_index = %(h3_id)s AND h3_resolution = %(h3_res)s),
+            (SELECT MAX(year) FROM {SCHEMA}.gbif_species_h3_mapping)
+        ) AS yr
+    ),
+    s AS (
+        SELECT DISTINCT ON (m.taxon_key) m.*, COALESCE(d.species_name, 'Unknown') AS species_name
+        FROM y
+        JOIN {SCHEMA}.gbif_species_h3_mapping m
+          ON m.year = y.yr AND m.h3_index = %(h3_id)s AND m.h3_resolution = %(h3_res)s
+        LEFT JOIN {SCHEMA}.gbif_species_dim d
+          ON d.taxon_key = m.taxon_key AND d.country = m.country AND d.year = m.year
+        ORDER BY m.taxon_key, m.occurrence_count DESC
+    )
+    SELECT y.yr AS _resolved_year, s.*
+    FROM y
+    LEFT JOIN s ON true
+    ORDER BY s.occurrence_count DESC NULLS LAST
+"""
 
 
 def handler(params: list[dict], body: dict | None = None) -> dict[str, Any]:
@@ -37,69 +55,27 @@ def handler(params: list[dict], body: dict | None = None) -> dict[str, Any]:
     year = validate_year(p.get("year"))
 
     with db.get_connection() as conn:
-        cur = conn.cursor()
-
-        if year is None:
-            cur.execute(
-                f"SELECT MAX(year) FROM {SCHEMA}.gbif_species_h3_mapping "
-                "WHERE h3_index = %s AND h3_resolution = %s",
-                [h3_id, h3_res],
-            )
-            row = cur.fetchone()
-            year = row[0] if row and row[0] else None
-            if year is None:
-                cur.execute(f"SELECT MAX(year) FROM {SCHEMA}.gbif_species_h3_mapping")
-                row = cur.fetchone()
-                year = row[0] if row and row[0] else None
-
-        year_clause = "AND m.year = %s" if year else ""
-        args: list[Any] = [h3_id, h3_res]
-        if year:
-            args.append(year)
-
-        q = f"""
-            SELECT m.*, COALESCE(d.species_name, 'Unknown') AS species_name
-            FROM {SCHEMA}.gbif_species_h3_mapping m
-            LEFT JOIN {SCHEMA}.gbif_species_dim d
-              ON d.taxon_key = m.taxon_key AND d.country = m.country AND d.year = m.year
-            WHERE m.h3_index = %s AND m.h3_resolution = %s {year_clause}
-            ORDER BY m.occurrence_count DESC
-        """
-        cur.execute(q, args)
-
-        rows = cur.fetchall()
-        cols = [d[0] for d in cur.description]
-        all_species = [dict(zip(cols, r)) for r in rows]
-
-        top_species = []
-        threatened = []
-        invasive = []
-        seen = set()
-
-        def _to_json_val(v):
-            if v is None:
-                return None
-            if isinstance(v, float) and v != v:
-                return None
-            if isinstance(v, (int, str, bool, float)):
-                return v
-            return str(v)
-
-        for s in all_species:
-            key = s.get("taxon_key")
-            if key in seen:
-                continue
-            seen.add(key)
-            entry = {k: _to_json_val(v) for k, v in s.items()}
-            entry["is_threatened"] = bool(s.get("is_threatened"))
-            entry["is_invasive"] = bool(s.get("is_invasive"))
-            top_species.append(entry)
-            if s.get("is_threatened"):
-                threatened.append(entry)
-            if s.get("is_invasive"):
-                invasive.append(entry)
+        # Server-side cursor: only itersize rows are materialized at a time.
+        # (Plain SQL rather than PREPARE/EXECUTE, which DECLARE cannot wrap.)
+        with conn.cursor(name="species_ctx", cursor_factory=psycopg2.extras.RealDictCursor) as cur:
+            cur.itersize = 1000
+            cur.execute(SPECIES_CONTEXT_SQL, {"h3_id": h3_id, "h3_res": h3_res, "year": year})
+            top_species = []
+            threatened = []
+            invasive = []
+            for s in cur:
+                year = s.pop("_resolved_year")
+                # A single all-NULL mapping row means the hex has no species for the resolved year
+                if s.get("h3_index") is None:
+                    continue
+                s["is_threatened"] = bool(s.get("is_threatened"))
+                s["is_invasive"] = bool(s.get("is_invasive"))
+                top_species.append(s)
+                if s["is_threatened"]:
+                    threatened.append(s)
+                if s["is_invasive"]:
+                    invasive.append(s)
 
-        cur.close()
         return {
             "h3_id": h3_id,
             "h3_resolution": h3_res,
@@ -3,6 +3,7 @@ GetNeighborHexes: Return k-ring neighbors for an H3 cell.
 """
 from __future__ import annotations
 
+import functools
 import hashlib
 import json
 import logging
@@ -10,20 +11,40 @@ from typing import Any
 
 import h3
 
+from .params import parse as _parse_params
 from .validation import validate_h3_id, validate_h3_resolution, validate_k_ring
 
 logger = logging.getLogger(__name__)
 
 
-def _parse_params(params: list[dict], body: dict | None) -> dict[str, Any]:
-    p = {x["name"]: x.get("value") for x in (params or []) if x.get("name")}
-    if body and isinstance(body, dict):
-        props = body.get("content", {}).get("application/json", {}).get("properties", [])
-        if isinstance(props, list):
-            for x in props:
-                if isinstance(x, dict) and x.get("name"):
-                    p[x["name"]] = x.get("value", p.get(x["name"]))
-    return p
+@functools.lru_cache(maxsize=4096)
+def _canonical(h3_id: str, h3_res: int) -> str:
+    """Return h3_id at h3_res (parent cell if finer); unchanged if not convertible."""
+    try:
+        if h3.get_resolution(h3_id) != h3_res:
+            return h3.cell_to_parent(h3_id, h3_res)
+    except Exception:
+        pass
+    return h3_id
+
+
+@functools.lru_cache(maxsize=4096)
+def _ring(h3_id: str, k: int) -> tuple[str, ...]:
+    return tuple(h3.grid_disk(h3_id, k))
+
+
+@functools.lru_cache(maxsize=1024)
+def _neighbors(h3_id: str, h3_res: int, k: int) -> tuple[str, tuple[str, ...], str]:
+    """Pure (h3_id, h3_res, k) -> (canonical cell, sorted neighbors, neighbor_set_id); cached per container."""
+    # Ensure we have the right resolution cell
+    h3_id = _canonical(h3_id, h3_res)
+
+    neighbors = [c for c in _ring(h3_id, k) if c != h3_id]
+    neighbors.sort()
+
+    # neighbor_set_id: deterministic hash for caching
+    neighbor_set_id = hashlib.blake2b(f"{h3_id}:{h3_res}:{k}".encode(), digest_size=8).hexdigest()
+    return h3_id, tuple(neighbors), neighbor_set_id
 
 
 def handler(params: list[dict], body: dict | None = None) -> dict[str, Any]:
@@ -37,27 +58,13 @@ def handler(params: list[dict], body: dict | None = None) -> dict[str, Any]:
     h3_res = validate_h3_resolution(p.get("h3_res") or p.get("h3Res"))
     k = validate_k_ring(p.get("k_ring") or p.get("kRing"))
 
-    # Ensure we have the right resolution cell
-    try:
-        res_actual = h3.get_resolution(h3_id)
-        if res_actual != h3_res:
-            parent = h3.cell_to_parent(h3_id, h3_res)
-            h3_id = parent
-    except Exception:
-        pass
-
-    ring = h3.grid_disk(h3_id, k)
-    neighbors = sorted(list(set(ring) - {h3_id}))
-
-    # neighbor_set_id: deterministic hash for caching
-    payload = f"{h3_id}:{h3_res}:{k}"
-    neighbor_set_id = hashlib.sha256(payload.encode()).hexdigest()[:16]
+    h3_id, neighbors, neighbor_set_id = _neighbors(h3_id, h3_res, k)
 
     return {
         "h3_id": h3_id,
         "h3_resolution": h3_res,
         "k_ring": k,
         "neighbor_count": len(neighbors),
-        "neighbor_h3_ids": neighbors,
+        "neighbor_h3_ids": list(neighbors),
         "neighbor_set_id": neighbor_set_id,
     }
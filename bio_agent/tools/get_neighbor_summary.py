@@ -1,49 +1,116 @@
 """
 GetNeighborSummary: Aggregated stats for a set of neighbor H3 cells.
+
+Both queries read only NEIGHBOR_COLUMNS, so Postgres can answer them with an index-only scan
+given the covering index created by gold_to_postgres (idx_gbif_cell_res_year_h3_cover):
+
+    CREATE INDEX IF NOT EXISTS idx_gbif_cell_res_year_h3_cover
+        ON <schema>.gbif_cell_metrics (h3_resolution, year, h3_index)
+        INCLUDE (observation_count, species_richness_cell, n_threatened_species, dqi, threat_score_weighted);
 """
 from __future__ import annotations
 
 import logging
-from typing import Any
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable
+
+import psycopg2.extras
 
 import db
-from .validation import validate_h3_id_list, validate_h3_resolution, validate_year
+from .params import parse as _parse_params
+from .validation import validate_h3_id_list, validate_h3_resolution, validate_top_k, validate_year
 
 logger = logging.getLogger(__name__)
 SCHEMA = db.schema()
 
+# Columns returned per neighbor (summary stats are aggregated in SQL)
+NEIGHBOR_COLUMNS = (
+    "h3_index", "year", "observation_count", "species_richness_cell",
+    "n_threatened_species", "dqi", "threat_score_weighted",
+)
+
+# Resolves the year (latest for these cells when none is given) and aggregates in one round-trip.
+# Summary stats are computed by Postgres; NaN is treated like NULL.
+SUMMARY_SQL = f"""
+    WITH y AS (
+        SELECT COALESCE(
+            %(year)s::int,
+            (SELECT MAX(year) FROM {SCHEMA}.gbif_cell_metrics
+             WHERE h3_index = ANY(%(h3_ids)s) AND h3_resolution = %(h3_res)s)
+        ) AS yr
+    )
+    SELECT
+        (SELECT yr FROM y) AS year,
+        AVG(NULLIF(c.species_richness_cell::float8, 'NaN')),
+        percentile_cont(0.5) WITHIN GROUP (ORDER BY NULLIF(c.species_richness_cell::float8, 'NaN')),
+        COALESCE(SUM(NULLIF(c.n_threatened_species::float8, 'NaN')), 0)::bigint,
+        AVG(NULLIF(c.dqi::float8, 'NaN')),
+        AVG(NULLIF(c.threat_score_weighted::float8, 'NaN')),
+        COUNT(*)
+    FROM {SCHEMA}.gbif_cell_metrics c
+    JOIN y ON c.year = y.yr
+    WHERE c.h3_index = ANY(%(h3_ids)s) AND c.h3_resolution = %(h3_res)s
+"""
+TOP_RISKY_SQL = f"""
+    SELECT {", ".join(NEIGHBOR_COLUMNS)}
+    FROM {SCHEMA}.gbif_cell_metrics
+    WHERE h3_index = ANY(%(h3_ids)s) AND h3_resolution = %(h3_res)s AND year = %(year)s
+    ORDER BY threat_score_weighted DESC NULLS LAST
+    LIMIT %(top_k)s
+"""
 
-def _parse_params(params: list[dict], body: dict | None) -> dict[str, Any]:
-    p = {x["name"]: x.get("value") for x in (params or []) if x.get("name")}
-    if body and isinstance(body, dict):
-        props = body.get("content", {}).get("application/json", {}).get("properties", [])
-        if isinstance(props, list):
-            for x in props:
-                if isinstance(x, dict) and x.get("name"):
-                    p[x["name"]] = x.get("value", p.get(x["name"]))
-        elif isinstance(props, dict):
-            p.update(props)
-    # Handle h3_ids as JSON string
-    h3_ids_raw = p.get("h3_ids") or p.get("h3Ids")
-    if isinstance(h3_ids_raw, str):
+# Per-container result cache keyed by (sorted h3_ids, h3_res, year, top_k). Identical concurrent
+# requests wait on the in-flight query (pending event) instead of hitting the DB again.
+CACHE_TTL_S = 300
+CACHE_MAX_ENTRIES = 1024
+_cache: OrderedDict[tuple, tuple[float, dict[str, Any]]] = OrderedDict()
+_pending: dict[tuple, threading.Event] = {}
+_cache_lock = threading.Lock()
+
+
+def _cache_get_or_compute(key: tuple, compute: Callable[[], dict[str, Any]]) -> tuple[dict[str, Any], bool]:
+    """Return (value, cache_hit). Only one caller per key runs compute(); others wait for it."""
+    while True:
+        with _cache_lock:
+            hit = _cache.get(key)
+            if hit is not None and time.monotonic() - hit[0] < CACHE_TTL_S:
+                _cache.move_to_end(key)
+                return hit[1], True
+            event = _pending.get(key)
+            owner = event is None
+            if owner:
+                event = _pending[key] = threading.Event()
+        if not owner:
+            event.wait()
+            continue  # re-check; if the owner failed, this caller takes over
         try:
-            import json
-            p["h3_ids"] = json.loads(h3_ids_raw)
-        except json.JSONDecodeError:
-            p["h3_ids"] = [x.strip() for x in h3_ids_raw.split(",") if x.strip()]
-    return p
+            value = compute()
+            with _cache_lock:
+                _cache[key] = (time.monotonic(), value)
+                _cache.move_to_end(key)
+                while len(_cache) > CACHE_MAX_ENTRIES:
+                    _cache.popitem(last=False)
+            return value, False
+        finally:
+            with _cache_lock:
+                _pending.pop(key, None)
+            event.set()
 
 
 def handler(params: list[dict], body: dict | None = None) -> dict[str, Any]:
     """
     GetNeighborSummary tool handler.
-    Input: h3_ids (list), h3_res, optional year
-    Output: aggregated stats (mean/median richness, total threatened, mean DQI, top risky neighbors)
+    Input: h3_ids (list), h3_res, optional year, optional top_k (default 10)
+    Output: aggregated stats over all cells (mean/median richness, total threatened, mean DQI)
+    and the top_k risky neighbors
     """
-    p = _parse_params(params or [], body)
-    h3_ids = validate_h3_id_list(p.get("h3_ids") or p.get("h3Ids"))
+    p = _parse_params(params or [], body, list_param_aliases={"h3_ids": ("h3_ids", "h3Ids")})
+    h3_ids = validate_h3_id_list(p["h3_ids"])
     h3_res = validate_h3_resolution(p.get("h3_res") or p.get("h3Res"))
     year = validate_year(p.get("year"))
+    top_k = validate_top_k(p.get("top_k") or p.get("topK"))
 
     if not h3_ids:
         return {
@@ -53,53 +120,26 @@ def handler(params: list[dict], body: dict | None = None) -> dict[str, Any]:
             "message": "No valid H3 IDs provided",
         }
 
-    placeholders = ", ".join(["%s"] * len(h3_ids))
-    args: list[Any] = list(h3_ids) + [h3_res]
-    year_clause = ""
-    if year is not None:
-        year_clause = " AND year = %s"
-        args.append(year)
+    key = (tuple(sorted(h3_ids)), h3_res, year, top_k)
+    result, cache_hit = _cache_get_or_compute(key, lambda: _query_summary(h3_ids, h3_res, year, top_k))
+    if year is None and result.get("year") is not None:
+        # Also serve later explicit-year requests for the resolved year from cache
+        with _cache_lock:
+            _cache.setdefault((key[0], h3_res, result["year"], top_k), (time.monotonic(), result))
+    return {**result, "cache_hit": cache_hit}
+
+
+def _query_summary(h3_ids: list[str], h3_res: int, year: int | None, top_k: int) -> dict[str, Any]:
+    """Run the metrics queries for h3_ids and build the GetNeighborSummary response."""
+    # h3_ids is bound once as an array, so the statement shape is the same for any list length
+    args: dict[str, Any] = {"h3_ids": list(h3_ids), "h3_res": h3_res, "year": year, "top_k": top_k}
 
     with db.get_connection() as conn:
-        cur = conn.cursor()
-
-        # If no year, use latest year in data
-        if year is None:
-            cur.execute(
-                f"SELECT MAX(year) FROM {SCHEMA}.gbif_cell_metrics "
-                f"WHERE h3_index IN ({placeholders}) AND h3_resolution = %s",
-                list(h3_ids) + [h3_res],
-            )
-            row = cur.fetchone()
-            if row and row[0]:
-                year = row[0]
-                year_clause = " AND year = %s"
-                args = list(h3_ids) + [h3_res, year]
-
-        q = f"""
-            SELECT *
-            FROM {SCHEMA}.gbif_cell_metrics
-            WHERE h3_index IN ({placeholders}) AND h3_resolution = %s
-            """ + year_clause + """
-            ORDER BY threat_score_weighted DESC NULLS LAST
-        """
-        cur.execute(q, args)
-        rows = cur.fetchall()
-        cols = [d[0] for d in cur.description]
-
-        def _to_json_val(v):
-            if v is None:
-                return None
-            if isinstance(v, float) and v != v:
-                return None
-            if isinstance(v, (int, str, bool, float)):
-                return v
-            return str(v)
-
-        cells = [{k: _to_json_val(v) for k, v in dict(zip(cols, r)).items()} for r in rows]
-
-        if not cells:
-            cur.close()
+        with conn.cursor() as cur:
+            cur.execute(SUMMARY_SQL, args)
+            year, mean_richness, median_richness, total_threatened, mean_dqi, mean_threat, cell_count = cur.fetchone()
+
+        if not cell_count:
             return {
                 "h3_ids": h3_ids,
                 "h3_resolution": h3_res,
@@ -109,39 +149,25 @@ def handler(params: list[dict], body: dict | None = None) -> dict[str, Any]:
                 "message": "No metrics found for given H3 cells",
             }
 
-        # Aggregate
-        richness = [c.get("species_richness_cell") for c in cells if c.get("species_richness_cell") is not None]
-        threatened = [c.get("n_threatened_species") for c in cells if c.get("n_threatened_species") is not None]
-        dqi_vals = [c.get("dqi") for c in cells if c.get("dqi") is not None]
-        threat_vals = [c.get("threat_score_weighted") for c in cells if c.get("threat_score_weighted") is not None]
-
-        def mean(v):
-            return sum(v) / len(v) if v else None
-
-        def median(v):
-            if not v:
-                return None
-            s = sorted(v)
-            mid = len(s) // 2
-            return (s[mid] + s[mid - 1]) / 2 if len(s) % 2 == 0 else s[mid]
-
-        summary = {
-            "mean_richness": round(mean(richness), 2) if richness else None,
-            "median_richness": round(median(richness), 2) if richness else None,
-            "total_threatened": sum(threatened) if threatened else 0,
-            "mean_dqi": round(mean(dqi_vals), 4) if dqi_vals else None,
-            "mean_threat_score": round(mean(threat_vals), 2) if threat_vals else None,
-            "cell_count": len(cells),
-        }
-
-        # All neighbors ordered by threat (risky first), full row data
-        top_risky = cells
-
-        cur.close()
-        return {
-            "h3_ids": h3_ids,
-            "h3_resolution": h3_res,
-            "year": year,
-            "summary": summary,
-            "top_risky_neighbors": top_risky,
-        }
+        # Only the top_k rows leave the database; at most 50, so a client-side cursor is enough
+        with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cur:
+            cur.execute(TOP_RISKY_SQL, {**args, "year": year})
+            cells = cur.fetchall()
+
+    summary = {
+        "mean_richness": round(mean_richness, 2) if mean_richness is not None else None,
+        "median_richness": round(median_richness, 2) if median_richness is not None else None,
+        "total_threatened": total_threatened,
+        "mean_dqi": round(mean_dqi, 4) if mean_dqi is not None else None,
+        "mean_threat_score": round(mean_threat, 2) if mean_threat is not None else None,
+        "cell_count": cell_count,
+    }
+
+    # top_k neighbors ordered by threat (risky first)
+    return {
+        "h3_ids": h3_ids,
+        "h3_resolution": h3_res,
+        "year": year,
+        "summary": summary,
+        "top_risky_neighbors": cells,
+    }
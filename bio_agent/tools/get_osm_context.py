@@ -1,27 +1,53 @@
 """
 GetOSMContext: OSM-derived features (roads, ports, airports, urban) for an H3 cell.
+
+The lookup is served by idx_osm_h3 (h3_index, h3_resolution). OSM_COLUMNS is wider than the
+32-column index limit, so no covering index is possible; the single heap fetch per call is cheap.
 """
 from __future__ import annotations
 
 import logging
 from typing import Any
 
+import psycopg2.extras
+
 import db
+from .params import parse as _parse_params
 from .validation import validate_h3_id, validate_h3_resolution
 
 logger = logging.getLogger(__name__)
 SCHEMA = db.schema()
 
-
-def _parse_params(params: list[dict], body: dict | None) -> dict[str, Any]:
-    p = {x["name"]: x.get("value") for x in (params or []) if x.get("name")}
-    if body and isinstance(body, dict):
-        props = body.get("content", {}).get("application/json", {}).get("properties", [])
-        if isinstance(props, list):
-            for x in props:
-                if isinstance(x, dict) and x.get("name"):
-                    p[x["name"]] = x.get("value", p.get(x["name"]))
-    return p
+# Counts, area shares and densities the agent reasons over; raw *_m2 areas are left out
+# since the *_pct columns carry the same information relative to the hex area.
+OSM_COLUMNS = (
+    # Transport
+    "road_count", "major_road_count", "trail_count", "rail_count", "port_feature_count", "airport_feature_count",
+    # Energy & industry
+    "pipeline_count", "power_line_count", "power_substation_count", "power_plant_count", "solar_plant_count",
+    "wind_plant_count", "hydro_plant_count", "industrial_area_count", "storage_tank_count", "fuel_station_count",
+    # Hydro & wetness
+    "waterway_count", "waterbody_count", "wetland_count", "coastline_count", "dam_count", "weir_count",
+    "lock_count", "water_barrier_count_total", "water_infra_poi_count",
+    # Built environment, land use & protection
+    "building_count", "amenity_count_total", "parks_green_count", "tree_rows_hedgerow_count",
+    "landuse_agriculture_count", "managed_forest_count", "natural_habitat_count", "protected_area_count",
+    "restricted_area_count", "admin_boundary_count", "barrier_count", "linear_disturbance_count", "waste_site_count",
+    # Area shares (% of hex)
+    "water_wetland_area_pct", "waterbody_area_pct", "waterway_area_pct", "wetland_area_pct", "road_area_pct",
+    "building_area_pct", "parks_green_area_pct", "agri_area_pct", "managed_forest_area_pct",
+    "natural_habitat_area_pct", "protected_area_pct", "restricted_area_pct", "human_footprint_area_pct",
+    "industrial_area_pct", "residential_area_pct", "commercial_area_pct", "parking_area_pct", "cemetery_area_pct",
+    "construction_area_pct", "retention_basin_area_pct", "urban_footprint_area_pct",
+    # Densities
+    "road_count_per_km2", "building_count_per_km2", "power_plant_count_per_km2", "protected_area_count_per_km2",
+)
+# Same single-row lookup on every call: PREPAREd once per pooled connection
+OSM_CONTEXT_SQL = f"""
+    SELECT {", ".join(OSM_COLUMNS)}
+    FROM {SCHEMA}.osm_hex_features
+    WHERE h3_index = $1 AND h3_resolution = $2
+"""
 
 
 def handler(params: list[dict], body: dict | None = None) -> dict[str, Any]:
@@ -35,16 +61,9 @@ def handler(params: list[dict], body: dict | None = None) -> dict[str, Any]:
     h3_res = validate_h3_resolution(p.get("h3_res") or p.get("h3Res"))
 
     with db.get_connection() as conn:
-        cur = conn.cursor()
-
-        q = f"""
-            SELECT *
-            FROM {SCHEMA}.osm_hex_features
-            WHERE h3_index = %s AND h3_resolution = %s
-        """
-        cur.execute(q, [h3_id, h3_res])
+        cur = conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor)
+        db.execute_prepared(cur, "osm_context_q", OSM_CONTEXT_SQL, [h3_id, h3_res])
         row = cur.fetchone()
-        cols = [d[0] for d in cur.description] if cur.description else []
 
         if not row:
             cur.close()
@@ -55,23 +74,10 @@ def handler(params: list[dict], body: dict | None = None) -> dict[str, Any]:
                 "message": "No OSM data found for this cell",
             }
 
-        r = dict(zip(cols, row))
         cur.close()
 
-        # Convert to JSON-serializable (handle float/None)
-        osm_context = {}
-        for k, v in r.items():
-            if v is None:
-                osm_context[k] = None
-            elif isinstance(v, (int, str, bool)):
-                osm_context[k] = v
-            elif isinstance(v, float):
-                osm_context[k] = v if not (v != v) else None  # NaN -> None
-            else:
-                osm_context[k] = str(v)
-
         return {
             "h3_id": h3_id,
             "h3_resolution": h3_res,
-            "osm_context": osm_context,
+            "osm_context": row,
         }
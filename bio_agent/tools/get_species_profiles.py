@@ -1,38 +1,40 @@
 """
 GetSpeciesProfiles: Profile text + sources for species (for agent narrative).
+
+The GBIF name fallback is a substring match on pre-lowercased patterns, which a btree cannot
+serve. gold_to_postgres creates the pg_trgm extension and a trigram GIN index on the same
+expression, so LIKE ANY(...) becomes an index lookup instead of a scan per name:
+
+    CREATE EXTENSION IF NOT EXISTS pg_trgm;
+    CREATE INDEX IF NOT EXISTS idx_species_dim_name_lower_trgm
+        ON <schema>.gbif_species_dim USING gin (LOWER(species_name) gin_trgm_ops);
 """
 from __future__ import annotations
 
 import logging
 from typing import Any
 
+import psycopg2.extras
+
 import db
+from .params import parse as _parse_params
 from .validation import validate_species_list
 
 logger = logging.getLogger(__name__)
 SCHEMA = db.schema()
 
-
-def _parse_params(params: list[dict], body: dict | None) -> dict[str, Any]:
-    p = {x["name"]: x.get("value") for x in (params or []) if x.get("name")}
-    if body and isinstance(body, dict):
-        props = body.get("content", {}).get("application/json", {}).get("properties", [])
-        if isinstance(props, list):
-            for x in props:
-                if isinstance(x, dict) and x.get("name"):
-                    p[x["name"]] = x.get("value", p.get(x["name"]))
-        elif isinstance(props, dict):
-            p.update(props)
-    ids_raw = p.get("species_ids") or p.get("species_names") or p.get("speciesIds") or p.get("speciesNames")
-    if isinstance(ids_raw, str):
-        try:
-            import json
-            p["species_ids_or_names"] = json.loads(ids_raw)
-        except json.JSONDecodeError:
-            p["species_ids_or_names"] = [x.strip() for x in ids_raw.split(",") if x.strip()]
-    else:
-        p["species_ids_or_names"] = ids_raw
-    return p
+# Name lookups are identical on every call: PREPAREd once per pooled connection
+IUCN_BY_NAMES_SQL = f"""
+    SELECT *
+    FROM {SCHEMA}.iucn_species_profiles
+    WHERE LOWER(scientific_name) = ANY($1::text[])
+"""
+GBIF_BY_NAME_PATTERNS_SQL = f"""
+    SELECT *
+    FROM {SCHEMA}.gbif_species_dim
+    WHERE LOWER(species_name) LIKE ANY($1::text[])
+    ORDER BY occurrence_count DESC NULLS LAST
+"""
 
 
 def handler(params: list[dict], body: dict | None = None) -> dict[str, Any]:
@@ -41,8 +43,12 @@ def handler(params: list[dict], body: dict | None = None) -> dict[str, Any]:
     Input: species_ids (taxon_key) OR species_names (scientific name)
     Output: profile_text + sources for each species
     """
-    p = _parse_params(params or [], body)
-    ids_or_names = validate_species_list(p.get("species_ids_or_names"))
+    p = _parse_params(
+        params or [],
+        body,
+        list_param_aliases={"species_ids_or_names": ("species_ids", "species_names", "speciesIds", "speciesNames")},
+    )
+    ids_or_names = validate_species_list(p["species_ids_or_names"])
 
     if not ids_or_names:
         return {
@@ -51,7 +57,7 @@ def handler(params: list[dict], body: dict | None = None) -> dict[str, Any]:
         }
 
     with db.get_connection() as conn:
-        cur = conn.cursor()
+        cur = conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor)
 
         # Try by taxon_key first (numeric)
         numeric = []
@@ -65,75 +71,59 @@ def handler(params: list[dict], body: dict | None = None) -> dict[str, Any]:
 
         profiles = []
 
-        def _to_json_val(v):
-            if v is None:
-                return None
-            if isinstance(v, float) and v != v:
-                return None
-            if isinstance(v, (int, str, bool, float)):
-                return v
-            return str(v)
-
         if numeric:
-            placeholders = ", ".join(["%s"] * len(numeric))
+            # taxon_key is stored as text: compare the bare column so idx_species_dim_taxon applies
             cur.execute(
                 f"""
                 SELECT DISTINCT ON (d.taxon_key) d.*
                 FROM {SCHEMA}.gbif_species_dim d
-                WHERE d.taxon_key::text IN ({placeholders})
+                WHERE d.taxon_key = ANY(%s::text[])
                 ORDER BY d.taxon_key, d.occurrence_count DESC NULLS LAST
                 """,
-                numeric,
+                [[str(int(x)) for x in numeric]],
             )
-            cols = [d[0] for d in cur.description]
-            for row in cur.fetchall():
-                r = dict(zip(cols, row))
+            for r in cur.fetchall():
                 r["source"] = "gbif_species_dim"
                 r["is_threatened"] = bool(r.get("is_threatened"))
                 r["is_invasive"] = bool(r.get("is_invasive"))
-                profiles.append({k: _to_json_val(v) for k, v in r.items()})
+                profiles.append(r)
 
         if names:
-            for name in names:
-                cur.execute(
-                    f"""
-                    SELECT *
-                    FROM {SCHEMA}.iucn_species_profiles
-                    WHERE LOWER(scientific_name) = LOWER(%s)
-                    """,
-                    [name],
+            lowered = [n.lower() for n in names]
+
+            # 1) Exact IUCN matches for all names in one query
+            db.execute_prepared(cur, "iucn_by_names_q", IUCN_BY_NAMES_SQL, [lowered])
+            iucn_by_name: dict[str, dict[str, Any]] = {}
+            for r in cur.fetchall():
+                iucn_by_name.setdefault((r.get("scientific_name") or "").lower(), r)
+
+            # 2) Substring GBIF fallback for the names IUCN did not know, also in one query
+            unmatched = [n for n in dict.fromkeys(lowered) if n not in iucn_by_name]
+            gbif_rows: list[dict[str, Any]] = []
+            if unmatched:
+                db.execute_prepared(
+                    cur, "gbif_by_name_patterns_q", GBIF_BY_NAME_PATTERNS_SQL, [[f"%{n}%" for n in unmatched]]
                 )
-                row = cur.fetchone()
-                if row:
-                    cols = [d[0] for d in cur.description]
-                    r = dict(zip(cols, row))
-                    r["source"] = "iucn_species_profiles"
-                    profiles.append({k: _to_json_val(v) for k, v in r.items()})
-                else:
-                    cur.execute(
-                        f"""
-                        SELECT *
-                        FROM {SCHEMA}.gbif_species_dim
-                        WHERE LOWER(species_name) LIKE LOWER(%s)
-                        ORDER BY occurrence_count DESC NULLS LAST
-                        """,
-                        [f"%{name}%"],
-                    )
-                    rows = cur.fetchall()
-                    if rows:
-                        cols = [d[0] for d in cur.description]
-                        for row in rows:
-                            r = dict(zip(cols, row))
-                            r["source"] = "gbif_species_dim"
-                            r["is_threatened"] = bool(r.get("is_threatened"))
-                            r["is_invasive"] = bool(r.get("is_invasive"))
-                            profiles.append({k: _to_json_val(v) for k, v in r.items()})
-                    else:
-                        profiles.append({
-                            "requested": name,
-                            "found": False,
-                            "message": "Species not found in database",
-                        })
+                gbif_rows = cur.fetchall()
+
+            # Re-associate rows with the requested names, preserving request order
+            for name, name_lower in zip(names, lowered):
+                iucn = iucn_by_name.get(name_lower)
+                if iucn is not None:
+                    profiles.append({**iucn, "source": "iucn_species_profiles"})
+                    continue
+                matches = [g for g in gbif_rows if name_lower in (g.get("species_name") or "").lower()]
+                if not matches:
+                    profiles.append({
+                        "requested": name,
+                        "found": False,
+                        "message": "Species not found in database",
+                    })
+                for g in matches:
+                    r = {**g, "source": "gbif_species_dim"}
+                    r["is_threatened"] = bool(r.get("is_threatened"))
+                    r["is_invasive"] = bool(r.get("is_invasive"))
+                    profiles.append(r)
 
         cur.close()
 
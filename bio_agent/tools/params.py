@@ -0,0 +1,47 @@
+"""
+Shared Bedrock parameter parsing for biodiversity agent tools.
+"""
+from __future__ import annotations
+
+import json
+from typing import Any
+
+
+def _as_list(raw: Any) -> Any:
+    """Unpack a JSON array or comma-separated string; other values are returned unchanged."""
+    if not isinstance(raw, str):
+        return raw
+    if raw.lstrip()[:1] == "[":
+        try:
+            return json.loads(raw)
+        except json.JSONDecodeError:
+            pass
+    return [x.strip() for x in raw.split(",") if x.strip()]
+
+
+def parse(
+    params: list[dict] | None,
+    body: dict | None,
+    *,
+    list_param_aliases: dict[str, tuple[str, ...]] | None = None,
+) -> dict[str, Any]:
+    """
+    Build flat dict of param name -> value from parameters list and requestBody properties.
+    For each key in list_param_aliases, the first non-empty alias is unpacked into a list
+    (Bedrock sends arrays as JSON or CSV strings) and stored under that key.
+    """
+    p = {x["name"]: x.get("value") for x in (params or []) if isinstance(x, dict) and x.get("name")}
+    if body and isinstance(body, dict):
+        content = body.get("content")
+        json_body = content.get("application/json") if isinstance(content, dict) else None
+        props = json_body.get("properties") if isinstance(json_body, dict) else None
+        if isinstance(props, list):
+            for x in props:
+                if isinstance(x, dict) and x.get("name"):
+                    p[x["name"]] = x.get("value", p.get(x["name"]))
+        elif isinstance(props, dict):
+            p.update(props)
+    for key, aliases in (list_param_aliases or {}).items():
+        raw = next((p[a] for a in aliases if p.get(a)), None)
+        p[key] = _as_list(raw)
+    return p
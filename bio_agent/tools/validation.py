@@ -4,22 +4,28 @@ Input validation for biodiversity agent tools.
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 from typing import Any
 
 import h3
 
+# H3 cell IDs are 15 hex chars; shorter forms are accepted and checked by h3 itself
+_H3_RE = re.compile(r"^[0-9a-fA-F]{8,15}$")
+
+
+@lru_cache(maxsize=4096)
+def _is_h3_cell(s: str) -> bool:
+    """Format + h3 validity check, memoized: agents re-validate the same cells across tools."""
+    return bool(_H3_RE.match(s)) and h3.is_valid_cell(s)
+
 
 def validate_h3_id(h3_id: str) -> str:
     """Validate H3 cell ID format."""
     if not h3_id or not isinstance(h3_id, str):
         raise ValueError("h3_id must be a non-empty string")
     h3_id = str(h3_id).strip()
-    if not re.match(r"^[0-9a-fA-F]{8,15}$", h3_id):
+    if not _is_h3_cell(h3_id):
         raise ValueError(f"Invalid H3 ID format: {h3_id}")
-    try:
-        h3.get_resolution(h3_id)
-    except Exception as e:
-        raise ValueError(f"Invalid H3 ID format: {h3_id}") from e
     return h3_id
 
 
@@ -110,15 +116,9 @@ def validate_h3_id_list(h3_ids: Any) -> list[str]:
         h3_ids = [h3_ids]
     if not isinstance(h3_ids, list):
         raise ValueError("h3_ids must be a list or string")
-    out = []
-    for h in h3_ids:
-        s = str(h).strip()
-        if s:
-            try:
-                validate_h3_id(s)
-                out.append(s)
-            except ValueError:
-                pass  # skip invalid
+    # Single pass; invalid IDs are skipped rather than raised
+    candidates = (str(h).strip() for h in h3_ids)
+    out = [s for s in candidates if s and _is_h3_cell(s)]
     if len(out) > 100:
         raise ValueError("Maximum 100 H3 cells per request")
     return out
@@ -15,8 +15,9 @@ Run:
 from __future__ import annotations
 
 import base64
-import json
+import re
 import warnings
+from functools import lru_cache
 from typing import Any
 from pathlib import Path
 
@@ -57,6 +58,7 @@ import boto3  # noqa: E402
 from botocore.config import Config  # noqa: E402
 import folium  # noqa: E402
 import h3  # noqa: E402
+import numpy as np  # noqa: E402
 import pandas as pd  # noqa: E402
 import s3fs  # noqa: E402
 from streamlit_folium import st_folium  # noqa: E402
@@ -70,6 +72,22 @@ except ImportError:
     duckdb = None  # type: ignore[assignment]
     _DUCKDB_AVAILABLE = False
 
+# orjson is optional – folium falls back to the stdlib json encoder without it
+try:
+    import orjson
+
+    def _orjson_dumps(obj: Any, **_kwargs: Any) -> str:
+        """json.dumps stand-in for Jinja's tojson (stdlib kwargs like sort_keys are ignored)."""
+        return orjson.dumps(
+            obj, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        ).decode()
+
+    # All folium templates share one Jinja environment; this is where the
+    # GeoJSON FeatureCollection is serialised ({{ this.data|tojson }}).
+    folium.GeoJson._template.environment.policies["json.dumps_function"] = _orjson_dumps
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 # ─────────────────────────────────────────────────────────────────────────────
 # CONSTANTS
 # ─────────────────────────────────────────────────────────────────────────────
@@ -87,6 +105,10 @@ NATURE2000_SNAPSHOT_DATE = "2026-02-27"
 MAX_PROTECTED_HEXES_DISPLAY = 50_000
 AWS_PROFILE = os.getenv("AWS_PROFILE", "") #"486717354268_PowerUserAccess"
 COUNTRY = "ES"
+# All cell-metric partitions of COUNTRY; queries filter on the Hive keys
+GOLD_METRICS_GLOB = (
+    f"s3://{S3_BUCKET}/{GOLD_PREFIX}/country={COUNTRY}/year=*/h3_resolution=*/*.parquet"
+)
 MAX_CHOSEN_HEXES = 6
 ENABLE_LANDING = True
 
@@ -119,6 +141,10 @@ DETAIL_METRICS: list[str] = [
     "dqi",
 ]
 
+# Columns the map, cell-stats and summary panels read; the rest of the partition
+# is only loaded (lazily) for the full cell detail on click.
+MAP_COLUMNS: tuple[str, ...] = tuple(dict.fromkeys(["h3_index", *COLOR_METRICS, *DETAIL_METRICS]))
+
 # Choropleth colour scale (colorbrewer YlOrRd)
 COLOR_SCALE: list[tuple[float, str]] = [
     (0.0, "#ffffb2"),
@@ -129,10 +155,21 @@ COLOR_SCALE: list[tuple[float, str]] = [
     (1.0, "#bd0026"),
 ]
 
+# COLOR_SCALE as arrays for vectorised interpolation
+_SCALE_STOPS = np.array([t for t, _ in COLOR_SCALE], dtype=np.float64)
+_SCALE_RGB = np.array(
+    [[int(c[i : i + 2], 16) for i in (1, 3, 5)] for _, c in COLOR_SCALE],
+    dtype=np.float64,
+)
+
 MAP_CENTER = [40.3, -3.7]  # centre of Spain
 MAP_ZOOM = 6
 MAX_HEXES_DEFAULT = 20_000
 MAX_HEXES_CAP = 20_000
+# Boundary coordinates are rounded to this many decimals (~0.1 m) in the GeoJSON
+COORD_DECIMALS = 6
+# Viewport clip padding, as a fraction of the bounds' span on each side
+BOUNDS_PAD_FRAC = 0.05
 
 # Bedrock Agent (biodiversity risk analysis)
 BEDROCK_AGENT_ID = "1XGKFMJE8D"
@@ -151,6 +188,25 @@ def get_s3fs() -> s3fs.S3FileSystem:
     s3fs.S3FileSystem.clear_instance_cache()
     return s3fs.S3FileSystem(profile=AWS_PROFILE)
 
+@st.cache_resource
+def get_arrow_s3fs():
+    """
+    Return a cached pyarrow-native S3FileSystem using the configured AWS profile.
+    Reads stay in Arrow's C++ S3 client instead of calling back into Python (fsspec)
+    for every block, so scans are not serialised on the GIL.
+    """
+    from pyarrow import fs as pa_fs
+
+    session = boto3.Session(profile_name=AWS_PROFILE)
+    creds = session.get_credentials().get_frozen_credentials()
+    return pa_fs.S3FileSystem(
+        region=session.region_name or "eu-west-1",
+        access_key=creds.access_key,
+        secret_key=creds.secret_key,
+        session_token=creds.token,
+    )
+
+
 @st.cache_resource
 def get_duckdb_con():
     """
@@ -175,6 +231,21 @@ def get_duckdb_con():
     if creds.token:
         con.execute(f"SET s3_session_token='{creds.token}';")
 
+    # S3 scans are bandwidth-bound: use every core, reuse connections and cache
+    # Parquet footers / HTTP metadata across reruns. Settings unknown to the
+    # installed DuckDB build are skipped.
+    for setting in (
+        f"SET threads={os.cpu_count() or 4}",
+        "SET http_keep_alive=true",
+        "SET http_retries=5",
+        "SET enable_http_metadata_cache=true",
+        "SET enable_object_cache=true",
+    ):
+        try:
+            con.execute(setting)
+        except duckdb.Error:
+            pass
+
     return con
 
 
@@ -224,11 +295,21 @@ def invoke_bedrock_agent(
 # ─────────────────────────────────────────────────────────────────────────────
 
 
-@st.cache_data(ttl=600, show_spinner="Loading gold data from S3…")
-def load_data(h3_res: int, year: int) -> pd.DataFrame:
+@st.cache_resource(ttl=600, show_spinner="Loading gold data from S3…")
+def load_data(
+    h3_res: int, year: int, columns: tuple[str, ...] | None = None
+) -> pd.DataFrame:
     """
     Load one (country, year, h3_resolution) partition from the gold layer.
 
+    Cached as a shared resource: every rerun gets the same frame instead of a
+    fresh copy (st.cache_data unpickles one per hit). Callers must not mutate it
+    in place – filter, or .copy() first (prepare_layer does).
+
+    columns: project only these columns (missing ones are skipped); None = all.
+    Projection is pushed down into the Parquet scan, so unread columns are
+    never fetched from S3.
+
     Primary path: DuckDB httpfs (fast, streaming scan from S3).
     Fallback: pyarrow.dataset with unify_schemas=True, which handles the common
     ArrowTypeError where the same column is encoded as dictionary<string> in
@@ -236,10 +317,13 @@ def load_data(h3_res: int, year: int) -> pd.DataFrame:
     """
     import pyarrow.dataset as pa_ds
     import pyarrow as pa
+    from pyarrow import fs as pa_fs
 
-    s3_path = (
-        f"s3://{S3_BUCKET}/{GOLD_PREFIX}"
-        f"/country={COUNTRY}/year={year}/h3_resolution={h3_res}/*.parquet"
+    # COLUMNS('^(a|b)$') selects whichever of the requested columns exist
+    select = (
+        "COLUMNS('^(" + "|".join(re.escape(c) for c in columns) + ")$')"
+        if columns
+        else "*"
     )
 
     con = get_duckdb_con()
@@ -247,16 +331,22 @@ def load_data(h3_res: int, year: int) -> pd.DataFrame:
         if con is None:
             raise RuntimeError("duckdb not available")
         df = con.execute(
-            f"SELECT * FROM read_parquet('{s3_path}', hive_partitioning=true)"
+            # One glob over every partition; the WHERE on the Hive keys prunes files,
+            # and the statement text is the same for every partition, so switching
+            # year/resolution reuses the cached metadata and plan.
+            f"SELECT {select} FROM read_parquet('{GOLD_METRICS_GLOB}', hive_partitioning=true, "
+            "union_by_name=true) WHERE year = ? AND h3_resolution = ?",
+            [year, h3_res],
         ).df()
     except Exception as exc:
         warnings.warn(f"DuckDB read failed ({exc}), falling back to pyarrow.dataset.")
-        fs = get_s3fs()
+        fs = get_arrow_s3fs()
         raw_path = (
             f"{S3_BUCKET}/{GOLD_PREFIX}"
             f"/country={COUNTRY}/year={year}/h3_resolution={h3_res}"
         )
-        files = fs.glob(f"{raw_path}/*.parquet")
+        infos = fs.get_file_info(pa_fs.FileSelector(raw_path, allow_not_found=True))
+        files = [i.path for i in infos if i.path.endswith(".parquet")]
         if not files:
             return pd.DataFrame()
 
@@ -270,7 +360,10 @@ def load_data(h3_res: int, year: int) -> pd.DataFrame:
         )
         # Cast every dictionary-encoded column to plain string before converting
         # to pandas – this is the root cause of the ArrowTypeError.
-        table = dataset.to_table()
+        table = dataset.to_table(
+            columns=[c for c in columns if c in dataset.schema.names] if columns else None,
+            use_threads=True,
+        )
         cast_fields = []
         for field in table.schema:
             if pa.types.is_dictionary(field.type):
@@ -282,7 +375,17 @@ def load_data(h3_res: int, year: int) -> pd.DataFrame:
             table = table.set_column(
                 col_idx, col_name, table.column(col_name).cast(target_type)
             )
-        df = table.to_pandas()
+        # Arrow-backed columns: no NumPy copy, and Arrow buffers are released as
+        # each column is converted (self_destruct) instead of doubling peak memory.
+        df = table.to_pandas(
+            types_mapper=pd.ArrowDtype, self_destruct=True, split_blocks=True
+        )
+        del table
+
+    # h3_index is unique within a partition, so a dictionary encoding would not
+    # shrink it; an Arrow string column does (one buffer instead of a str per row).
+    if "h3_index" in df.columns and df["h3_index"].dtype == object:
+        df["h3_index"] = df["h3_index"].astype(pd.ArrowDtype(pa.string()))
 
     # Inject partition keys if they were stripped by Hive partitioning
     if "country" not in df.columns:
@@ -590,24 +693,46 @@ def load_osm_hex_features(h3_res: int, h3_indexes: list[str]) -> pd.DataFrame:
 # ─────────────────────────────────────────────────────────────────────────────
 
 
-def _metric_to_color(value: float, vmin: float, vmax: float) -> str:
-    """Map a scalar metric value to a hex colour using the COLOR_SCALE."""
+def _metric_to_colors(values: np.ndarray, vmin: float, vmax: float) -> list[str]:
+    """Map metric values to hex colours along COLOR_SCALE in one vectorised pass."""
+    values = np.asarray(values, dtype=np.float64)
     if vmax == vmin:
-        t = 0.0
+        t = np.zeros_like(values)
     else:
-        t = max(0.0, min(1.0, (value - vmin) / (vmax - vmin)))
-
-    # Linear interpolation between colour stops
-    for i in range(len(COLOR_SCALE) - 1):
-        t0, c0 = COLOR_SCALE[i]
-        t1, c1 = COLOR_SCALE[i + 1]
-        if t <= t1:
-            frac = (t - t0) / (t1 - t0) if t1 > t0 else 0.0
-            r = int(int(c0[1:3], 16) + frac * (int(c1[1:3], 16) - int(c0[1:3], 16)))
-            g = int(int(c0[3:5], 16) + frac * (int(c1[3:5], 16) - int(c0[3:5], 16)))
-            b = int(int(c0[5:7], 16) + frac * (int(c1[5:7], 16) - int(c0[5:7], 16)))
-            return f"#{r:02x}{g:02x}{b:02x}"
-    return COLOR_SCALE[-1][1]
+        t = np.clip((values - vmin) / (vmax - vmin), 0.0, 1.0)
+
+    # Linear interpolation between colour stops (segment i covers stops[i]..stops[i+1])
+    idx = np.clip(np.searchsorted(_SCALE_STOPS, t, side="left") - 1, 0, len(_SCALE_STOPS) - 2)
+    t0, t1 = _SCALE_STOPS[idx], _SCALE_STOPS[idx + 1]
+    frac = (t - t0) / (t1 - t0)
+    rgb = (_SCALE_RGB[idx] + frac[:, None] * (_SCALE_RGB[idx + 1] - _SCALE_RGB[idx])).astype(np.int64)
+    return [f"#{r:02x}{g:02x}{b:02x}" for r, g, b in rgb.tolist()]
+
+
+def _h3_centres(h3_cells: pd.Series) -> tuple[np.ndarray, np.ndarray]:
+    """Return (lat, lng) float64 arrays of the H3 cell centres, row-aligned with h3_cells."""
+    cells = h3_cells.to_numpy(dtype=str)
+    # Stream centres straight into a float64 buffer (no list of tuples)
+    latlngs = np.fromiter(
+        (v for c in cells for v in h3.cell_to_latlng(c)),
+        dtype=np.float64,
+        count=2 * len(cells),
+    ).reshape(-1, 2)
+    return latlngs[:, 0], latlngs[:, 1]
+
+
+@st.cache_resource(ttl=600, show_spinner=False)
+def cell_centres(
+    h3_res: int, year: int, columns: tuple[str, ...] | None = None
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    (lat, lng) centre arrays aligned with the rows of load_data(h3_res, year, columns),
+    computed once per partition so viewport clipping is a pure NumPy comparison.
+    """
+    df = load_data(h3_res, year, columns=columns)
+    if df.empty or "h3_index" not in df.columns:
+        return np.empty(0), np.empty(0)
+    return _h3_centres(df["h3_index"])
 
 
 def prepare_layer(
@@ -616,6 +741,7 @@ def prepare_layer(
     max_hexes: int,
     mode: str = "top_n",
     snapshot_bounds: dict | None = None,
+    centres: tuple[np.ndarray, np.ndarray] | None = None,
 ) -> tuple[pd.DataFrame, bool, str]:
     """
     Select rows for rendering.
@@ -624,44 +750,51 @@ def prepare_layer(
     mode="request_bounds"    – transient: same as top_n while we wait for one
                                bounds snapshot to come back from the browser.
     mode="viewport_snapshot" – ALL cells whose H3 centre falls inside the
-                               snapshot bounds captured on button click.
+                               snapshot bounds (padded by BOUNDS_PAD_FRAC)
+                               captured on button click.
+
+    centres: optional (lat, lng) arrays aligned with df (see cell_centres);
+    computed from h3_index when missing or stale.
 
     Returns: (df_layer, was_sampled, mode_used)
     """
-    import numpy as np
-
     if df.empty:
         return df, False, mode
 
     if color_metric not in df.columns:
         color_metric = "observation_count"
 
-    df = df.copy()
-    df[color_metric] = pd.to_numeric(df[color_metric], errors="coerce").fillna(0)
-
-    # ── Viewport snapshot: filter to cells inside the captured bounds ─────────
+    # ── Viewport snapshot: clip to the captured bounds before any other work ──
     if mode == "viewport_snapshot" and snapshot_bounds:
         sw = snapshot_bounds.get("_southWest", {})
         ne = snapshot_bounds.get("_northEast", {})
         if sw and ne:
             lat_min, lat_max = float(sw["lat"]), float(ne["lat"])
             lng_min, lng_max = float(sw["lng"]), float(ne["lng"])
+            lat_pad = (lat_max - lat_min) * BOUNDS_PAD_FRAC
+            lng_pad = (lng_max - lng_min) * BOUNDS_PAD_FRAC
 
-            h3_cells = df["h3_index"].to_numpy(dtype=str)
-            latlngs = np.array([h3.cell_to_latlng(c) for c in h3_cells])
-            lat_arr, lng_arr = latlngs[:, 0], latlngs[:, 1]
+            if centres is None or len(centres[0]) != len(df):
+                centres = _h3_centres(df["h3_index"])
+            lat_arr, lng_arr = centres
 
             mask = (
-                (lat_arr >= lat_min)
-                & (lat_arr <= lat_max)
-                & (lng_arr >= lng_min)
-                & (lng_arr <= lng_max)
+                (lat_arr >= lat_min - lat_pad)
+                & (lat_arr <= lat_max + lat_pad)
+                & (lng_arr >= lng_min - lng_pad)
+                & (lng_arr <= lng_max + lng_pad)
             )
-            df_vp = df[mask]
-            if not df_vp.empty:
+            if mask.any():
+                df_vp = df[mask].copy()
+                df_vp[color_metric] = pd.to_numeric(
+                    df_vp[color_metric], errors="coerce"
+                ).fillna(0)
                 return df_vp, False, "viewport_snapshot"
         # fell through (no bounds or empty result) → fall back to top_n
 
+    df = df.copy()
+    df[color_metric] = pd.to_numeric(df[color_metric], errors="coerce").fillna(0)
+
     # ── Top-N (default and request_bounds transient state) ────────────────────
     was_sampled = len(df) > max_hexes
     if was_sampled:
@@ -669,16 +802,20 @@ def prepare_layer(
     return df, was_sampled, "top_n"
 
 
-def _h3_boundary_latlon(h3_index: str) -> list[list[float]]:
+@lru_cache(maxsize=262_144)
+def _h3_ring_lnglat(h3_index: str) -> tuple[tuple[float, float], ...]:
     """
-    Return H3 cell boundary as [[lat, lon], ...] for Folium.
+    Return the closed H3 cell boundary ring as ((lng, lat), ...) for GeoJSON.
     h3-py ≥4 returns (lat, lng) tuples from h3.cell_to_boundary().
+    Cached per process: cell geometry never changes and the same cells are
+    redrawn on every rerun. Rounded to COORD_DECIMALS, which roughly halves the
+    serialised size of each coordinate.
     """
-    boundary = h3.cell_to_boundary(h3_index)  # list of (lat, lng)
-    # Close the polygon ring for GeoJSON
-    coords = [[lat, lng] for lat, lng in boundary]
-    coords.append(coords[0])
-    return coords
+    ring = tuple(
+        (round(lng, COORD_DECIMALS), round(lat, COORD_DECIMALS))
+        for lat, lng in h3.cell_to_boundary(h3_index)
+    )
+    return ring + ring[:1]
 
 
 def build_geojson_from_h3_cells(
@@ -696,23 +833,21 @@ def build_geojson_from_h3_cells(
     occ = occurrence_col if occurrence_col in df.columns else None
     if occ:
         values = df[occurrence_col].fillna(0).astype(float)
-        vmin, vmax = float(values.min()), float(values.max())
+        colors = _metric_to_colors(
+            values.to_numpy(), float(values.min()), float(values.max())
+        )
 
     features: list[dict] = []
-    for _, row in df.iterrows():
+    for i, (_, row) in enumerate(df.iterrows()):
         h3_idx = str(row.get("h3_index", ""))
         if not h3_idx:
             continue
         try:
-            boundary = _h3_boundary_latlon(h3_idx)
+            ring = _h3_ring_lnglat(h3_idx)
         except Exception:
             continue
 
-        if occ:
-            val = float(row.get(occurrence_col) or 0)
-            color = _metric_to_color(val, vmin, vmax)
-        else:
-            color = fill_color
+        color = colors[i] if occ else fill_color
 
         props: dict[str, Any] = {"h3_index": h3_idx, "_color": color}
         if occ:
@@ -722,7 +857,7 @@ def build_geojson_from_h3_cells(
                 "type": "Feature",
                 "geometry": {
                     "type": "Polygon",
-                    "coordinates": [[[lng, lat] for lat, lng in boundary]],
+                    "coordinates": [ring],
                 },
                 "properties": props,
             }
@@ -731,6 +866,24 @@ def build_geojson_from_h3_cells(
     return {"type": "FeatureCollection", "features": features}
 
 
+@st.cache_resource(max_entries=32, show_spinner=False)
+def _cell_geometries(h3_indices: tuple[str, ...]) -> list[dict[str, Any] | None]:
+    """
+    GeoJSON Polygon geometry per H3 cell (None for invalid ids), in input order.
+
+    Kept as a shared resource (no per-hit copy): the rendered cell set rarely
+    changes between reruns, so a metric switch or click only redoes colours and
+    properties. The geometry dicts are never mutated by callers.
+    """
+    geoms: list[dict[str, Any] | None] = []
+    for h3_idx in h3_indices:
+        try:
+            geoms.append({"type": "Polygon", "coordinates": [_h3_ring_lnglat(h3_idx)]})
+        except Exception:
+            geoms.append(None)
+    return geoms
+
+
 def build_geojson_layer(
     df: pd.DataFrame,
     color_metric: str,
@@ -741,46 +894,52 @@ def build_geojson_layer(
     Each feature carries ALL metric columns as properties so the click handler
     can display a rich info panel without a second lookup.
     """
-    if df.empty:
+    if df.empty or "h3_index" not in df.columns:
         return {"type": "FeatureCollection", "features": []}
 
     metric_col = color_metric if color_metric in df.columns else "observation_count"
-    values = df[metric_col].fillna(0).astype(float)
-    vmin, vmax = float(values.min()), float(values.max())
+    values = df[metric_col].fillna(0).astype(float).to_numpy()
+    colors = _metric_to_colors(values, float(values.min()), float(values.max()))
+    geoms = _cell_geometries(tuple(df["h3_index"].astype(str)))
+
+    # Columnar access: one JSON-safe list per column instead of a dict per row
+    # (works with any column name, no getattr fragility)
+    columns = [(str(c), _json_column(df[c])) for c in df.columns]
 
     features: list[dict] = []
-    # Use to_dict("records") – works with any column name, no getattr fragility
-    for record in df.to_dict("records"):
-        h3_idx = str(record.get("h3_index", ""))
-        if not h3_idx:
-            continue
-        try:
-            boundary = _h3_boundary_latlon(h3_idx)
-        except Exception:
+    for i in range(len(df)):
+        if geoms[i] is None:
             continue
 
-        val = float(record.get(metric_col) or 0)
-        color = _metric_to_color(val, vmin, vmax)
+        props: dict[str, Any] = {c: vals[i] for c, vals in columns}
+        props["_color"] = colors[i]
+        props["_metric_value"] = float(values[i])
 
-        props: dict[str, Any] = {k: _safe_scalar(v) for k, v in record.items()}
-        props["_color"] = color
-        props["_metric_value"] = val
-
-        features.append(
-            {
-                "type": "Feature",
-                "geometry": {
-                    "type": "Polygon",
-                    # GeoJSON coordinates are [lon, lat]; boundary is [[lat, lon], ...]
-                    "coordinates": [[[lng, lat] for lat, lng in boundary]],
-                },
-                "properties": props,
-            }
-        )
+        features.append({"type": "Feature", "geometry": geoms[i], "properties": props})
 
     return {"type": "FeatureCollection", "features": features}
 
 
+def _json_column(s: pd.Series) -> list[Any]:
+    """
+    Convert a whole column to plain Python values safe for json.dumps(), choosing
+    the conversion once per dtype instead of type-checking every value.
+    NaN / ±Inf / NA become None.
+    """
+    if pd.api.types.is_float_dtype(s.dtype):
+        arr = s.to_numpy(dtype=np.float64, na_value=np.nan)
+        out = arr.tolist()
+        for j in np.flatnonzero(~np.isfinite(arr)):
+            out[j] = None
+        return out
+    if pd.api.types.is_integer_dtype(s.dtype) or pd.api.types.is_bool_dtype(s.dtype):
+        # .tolist() already yields native int / bool
+        if not s.hasnans:
+            return s.tolist()
+        return [None if na else v for v, na in zip(s.tolist(), s.isna().tolist())]
+    return [_safe_scalar(v) for v in s.tolist()]
+
+
 def _safe_scalar(v: Any) -> Any:
     """
     Convert any scalar to a plain Python type safe for json.dumps().
@@ -830,7 +989,7 @@ def build_geojson_protected_areas(df: pd.DataFrame) -> dict[str, Any]:
         if not h3_idx:
             continue
         try:
-            boundary = _h3_boundary_latlon(h3_idx)
+            ring = _h3_ring_lnglat(h3_idx)
         except Exception:
             continue
 
@@ -845,7 +1004,7 @@ def build_geojson_protected_areas(df: pd.DataFrame) -> dict[str, Any]:
                 "type": "Feature",
                 "geometry": {
                     "type": "Polygon",
-                    "coordinates": [[[lng, lat] for lat, lng in boundary]],
+                    "coordinates": [ring],
                 },
                 "properties": props,
             }
@@ -869,7 +1028,7 @@ def make_map_protected_areas(
 
     if geojson["features"]:
         folium.GeoJson(
-            data=json.dumps(geojson),
+            data=geojson,
             name="Protected Areas",
             style_function=lambda f: {
                 "fillColor": f["properties"].get("_color", "#cccccc"),
@@ -910,6 +1069,14 @@ def make_map_protected_areas(
     return m
 
 
+_HEX_STYLE = {"color": "#444444", "weight": 0.4, "fillOpacity": 0.65}
+
+
+def _hex_style(feature: dict[str, Any]) -> dict[str, Any]:
+    """Folium style_function: the colour is precomputed in build_geojson_layer."""
+    return {"fillColor": feature["properties"].get("_color", "#cccccc"), **_HEX_STYLE}
+
+
 def make_map(
     geojson: dict[str, Any],
     show_overlay: bool,
@@ -921,6 +1088,7 @@ def make_map(
     Build a Folium map with an optional H3 hex GeoJSON overlay.
 
     No highlight on selection – chosen hexes are only in the list, map does not re-style.
+    No hover highlight either: it adds mouseover/mouseout handlers to every feature.
     Click capture is handled via streamlit-folium's last_clicked mechanism.
     """
     m = folium.Map(
@@ -932,19 +1100,9 @@ def make_map(
 
     if show_overlay and geojson["features"]:
         folium.GeoJson(
-            data=json.dumps(geojson),
+            data=geojson,
             name="H3 Cells",
-            style_function=lambda feature: {
-                "fillColor": feature["properties"].get("_color", "#cccccc"),
-                "color": "#444444",
-                "weight": 0.4,
-                "fillOpacity": 0.65,
-            },
-            highlight_function=lambda feature: {
-                "weight": 2,
-                "color": "#000000",
-                "fillOpacity": 0.85,
-            },
+            style_function=_hex_style,
             tooltip=folium.GeoJsonTooltip(
                 fields=[color_metric],
                 aliases=[color_metric.replace("_", " ").title()],
@@ -1000,16 +1158,63 @@ def resolve_click_to_cell(
     return h3.latlng_to_cell(click_lat, click_lon, h3_res)
 
 
-def lookup_cell(df: pd.DataFrame, h3_index: str) -> pd.Series | None:
-    """Return the row for a given h3_index, or None if not found."""
+@st.cache_resource(ttl=600, show_spinner=False)
+def cell_positions(h3_res: int, year: int) -> dict[str, int]:
+    """h3_index -> first row position in load_data(h3_res, year), built once per partition."""
+    df = load_data(h3_res, year)
+    positions: dict[str, int] = {}
+    if not df.empty and "h3_index" in df.columns:
+        for i, h in enumerate(df["h3_index"].tolist()):
+            positions.setdefault(h, i)
+    return positions
+
+
+def lookup_cell(
+    df: pd.DataFrame, h3_index: str, positions: dict[str, int] | None = None
+) -> pd.Series | None:
+    """
+    Return the row for a given h3_index, or None if not found.
+    With positions (see cell_positions) this is a dict lookup instead of a scan.
+    """
     if df.empty or "h3_index" not in df.columns:
         return None
+    if positions is not None:
+        pos = positions.get(h3_index)
+        if pos is None:
+            return None
+        # The two caches expire independently; only trust the position if it still matches
+        if pos < len(df) and df["h3_index"].iat[pos] == h3_index:
+            return df.iloc[pos]
     mask = df["h3_index"] == h3_index
     if mask.any():
         return df[mask].iloc[0]
     return None
 
 
+@st.cache_data(ttl=600, max_entries=256, show_spinner=False)
+def load_cell_detail(h3_res: int, year: int, h3_index: str) -> pd.Series | None:
+    """
+    All columns for one cell, fetched on demand for the detail panel.
+
+    The map only loads MAP_COLUMNS; this reads the full row for the clicked
+    cell alone (DuckDB pushes the h3_index predicate down to row-group stats).
+    Falls back to the cached full partition when DuckDB is unavailable.
+    """
+    con = get_duckdb_con()
+    if con is not None:
+        try:
+            df = con.execute(
+                f"SELECT * FROM read_parquet('{GOLD_METRICS_GLOB}', hive_partitioning=true, "
+                "union_by_name=true) WHERE year = ? AND h3_resolution = ? AND h3_index = ? "
+                "LIMIT 1",
+                [year, h3_res, h3_index],
+            ).df()
+            return None if df.empty else df.iloc[0]
+        except Exception as exc:
+            warnings.warn(f"DuckDB cell lookup failed ({exc}), using the full partition.")
+    return lookup_cell(load_data(h3_res, year), h3_index, cell_positions(h3_res, year))
+
+
 def lookup_protected_cell(df: pd.DataFrame, h3_id: str) -> pd.Series | None:
     """Return the row for a given h3_id in nature2000 gold, or None if not found."""
     if df.empty or "h3_id" not in df.columns:
@@ -1027,7 +1232,7 @@ def lookup_protected_cell(df: pd.DataFrame, h3_id: str) -> pd.Series | None:
 
 def format_metric(value: Any) -> str:
     """Format a metric value for sidebar display."""
-    if value is None or (isinstance(value, float) and pd.isna(value)):
+    if value is None or value is pd.NA or (isinstance(value, float) and pd.isna(value)):
         return "—"
     if isinstance(value, float):
         return f"{value:,.4f}" if abs(value) < 10 else f"{value:,.1f}"
@@ -1401,6 +1606,7 @@ def render_chosen_card(chosen_hexes: set[str], h3_res: int) -> None:
                 ss["chosen_hexes"] = set()
                 ss["last_processed_click"] = None
                 ss["selected_cell"] = None
+                ss["selected_cell_rows"] = None
                 st.rerun()
         with b2:
             if st.button(
@@ -2175,7 +2381,10 @@ def render_osm_report_tab(chosen_hexes: set[str], h3_res: int, year: int) -> Non
 
         with st.spinner("Generating PDF…"):
             try:
-                from report_generator import generate_report
+                from report_generator import generate_report, prefetch_map
+
+                # Map tiles download while the agent call, data loads and charts run
+                prefetch_map(report_hex)
 
                 # Fetch AI insights from Bedrock agent
                 ai_insights = None
@@ -2329,32 +2538,44 @@ def render_osm_report_tab(chosen_hexes: set[str], h3_res: int, year: int) -> Non
         )
 
 
-def render_cell_panel(selected_cell: pd.Series | None, df_full: pd.DataFrame) -> None:
+def _build_detail_rows(cell_row: pd.Series | None) -> pd.DataFrame | None:
+    """
+    Metric/Value table for the selected-cell panel: DETAIL_METRICS first (with a
+    case-insensitive fallback), then any other non-underscore columns.
+    Built once per click and kept in session state, not on every rerun.
+    """
+    if cell_row is None:
+        return None
+    lc_cell = {str(k).lower(): v for k, v in cell_row.items()}
+    rows: list[dict] = []
+    for col in DETAIL_METRICS:
+        val = cell_row.get(col, None)
+        if val is None:
+            val = lc_cell.get(col.lower(), None)
+        rows.append({"Metric": col, "Value": format_metric(val)})
+    # Extra columns not in DETAIL_METRICS
+    detail = set(DETAIL_METRICS)
+    for col, val in cell_row.items():
+        if col not in detail and not str(col).startswith("_"):
+            rows.append({"Metric": col, "Value": format_metric(val)})
+    return pd.DataFrame(rows)
+
+
+def render_cell_panel(detail_rows: pd.DataFrame | None, df_full: pd.DataFrame) -> None:
     """
     Render the selected-cell stats panel + Top-5 table in the right column.
+    detail_rows is the precomputed table from _build_detail_rows.
     """
     st.markdown("### 📍 Selected cell")
 
-    if selected_cell is None:
+    if detail_rows is None:
         st.info("Click a hex on the map.")
     else:
-        rows: list[dict] = []
-        for col in DETAIL_METRICS:
-            val = selected_cell.get(col, None)
-            if val is None:
-                lc = {k.lower(): v for k, v in selected_cell.items()}
-                val = lc.get(col.lower(), None)
-            rows.append({"Metric": col, "Value": format_metric(val)})
-        # Extra columns not in DETAIL_METRICS
-        for col in selected_cell.index:
-            if col not in DETAIL_METRICS and not col.startswith("_"):
-                rows.append({"Metric": col, "Value": format_metric(selected_cell[col])})
-
         st.dataframe(
-            pd.DataFrame(rows),
+            detail_rows,
             use_container_width=True,
             hide_index=True,
-            height=min(480, 35 * len(rows) + 40),
+            height=min(480, 35 * len(detail_rows) + 40),
         )
 
     st.divider()
@@ -2370,7 +2591,8 @@ def render_cell_panel(selected_cell: pd.Series | None, df_full: pd.DataFrame) ->
         st.dataframe(top5, use_container_width=True, hide_index=False)
 
 
-def render_main(
+@st.fragment
+def render_map_and_cell_panel(
     df_full: pd.DataFrame,
     folium_map: folium.Map,
     was_sampled: bool,
@@ -2380,28 +2602,27 @@ def render_main(
     show_overlay: bool,
     n_layer: int,
     selected_year: int,
-) -> dict[str, Any] | None:
+) -> None:
     """
     Two-column layout: map (left 3/4) | cell stats (right 1/4).
-    Below: Top-10 table + summary stats.
-    Returns the raw st_folium output dict.
+
+    Runs as a fragment: a map click that only changes the selected cell reruns
+    this block (map + panel) instead of the whole script. The click is handled
+    before the panel is drawn, so such a click needs no further rerun at all.
+    Clicks that add to the chosen hexes, and the viewport buttons, still rerun
+    the full app since they change state rendered outside the fragment.
     """
     ss = st.session_state
 
     col_map, col_stats = st.columns([3, 1], gap="medium")
 
-    # ── Right column: cell stats ───────────────────────────────────────────────
-    with col_stats:
-        render_cell_panel(
-            ss.get("selected_cell"),
-            df_full,
-        )
-
     # ── Left column: map ──────────────────────────────────────────────────────
     with col_map:
         if df_full.empty:
             st.error("No data found for the selected country / year / resolution.")
-            return None
+            with col_stats:
+                render_cell_panel(ss.get("selected_cell_rows"), df_full)
+            return
 
         if mode_used == "viewport_snapshot" and n_layer > 10_000:
             st.warning(
@@ -2480,15 +2701,56 @@ def render_main(
                 ss["last_processed_click"] = click_key
 
                 h3_idx = resolve_click_to_cell(lat, lon, h3_res)
-                cell_row = lookup_cell(df_full, h3_idx)
+                # All columns for just this cell (the map frame only has MAP_COLUMNS)
+                cell_row = load_cell_detail(h3_res, selected_year, h3_idx)
 
                 chosen = set(ss.get("chosen_hexes", set()))
-                if len(chosen) < MAX_CHOSEN_HEXES and h3_idx not in chosen:
+                chosen_changed = len(chosen) < MAX_CHOSEN_HEXES and h3_idx not in chosen
+                if chosen_changed:
                     chosen.add(h3_idx)
                 ss["chosen_hexes"] = chosen  # reasignación (no in-place)
 
                 ss["selected_cell"] = cell_row
-                st.rerun()
+                ss["selected_cell_rows"] = _build_detail_rows(cell_row)
+                # Chosen-hexes card and tabs live outside the fragment. An unchanged
+                # selection needs no rerun: the panel below reads the new rows.
+                if chosen_changed:
+                    st.rerun(scope="app")
+
+    # ── Right column: cell stats (drawn after the click is handled) ───────────
+    with col_stats:
+        render_cell_panel(
+            ss.get("selected_cell_rows"),
+            df_full,
+        )
+
+
+def render_main(
+    df_full: pd.DataFrame,
+    folium_map: folium.Map,
+    was_sampled: bool,
+    mode_used: str,
+    color_metric: str,
+    h3_res: int,
+    show_overlay: bool,
+    n_layer: int,
+    selected_year: int,
+) -> None:
+    """
+    Map + cell stats (see render_map_and_cell_panel).
+    Below: Top-10 table + summary stats.
+    """
+    render_map_and_cell_panel(
+        df_full,
+        folium_map,
+        was_sampled,
+        mode_used,
+        color_metric,
+        h3_res,
+        show_overlay,
+        n_layer,
+        selected_year,
+    )
 
     # ── Below: Top 10 + summary ───────────────────────────────────────────────
     if not df_full.empty:
@@ -2533,8 +2795,6 @@ def render_main(
                 )
             st.caption(f"**{len(df_full):,}** cells · res **{h3_res}** · {COUNTRY}")
 
-    return map_data
-
 
 # ─────────────────────────────────────────────────────────────────────────────
 # MAIN
@@ -2566,6 +2826,7 @@ def main() -> None:
     ss = st.session_state
     ss.setdefault("trigger_generate_report", False)
     ss.setdefault("selected_cell", None)
+    ss.setdefault("selected_cell_rows", None)
     ss.setdefault("chosen_hexes", set())  # set of h3_index, max 6
     ss.setdefault(
         "last_processed_click", None
@@ -2584,6 +2845,7 @@ def main() -> None:
     # Clear selected cell + chosen hexes + reset view mode when year or resolution changes.
     if selected_year != ss["prev_year"] or h3_res != ss["prev_h3_res"]:
         ss["selected_cell"] = None
+        ss["selected_cell_rows"] = None
         ss["chosen_hexes"] = set()
         ss["last_processed_click"] = None
         ss["view_mode"] = "top_n"
@@ -2592,7 +2854,8 @@ def main() -> None:
         ss["prev_h3_res"] = h3_res
 
     # ── Load data (cached) ────────────────────────────────────────────────────
-    df_full = load_data(h3_res, selected_year)
+    # Only the columns the map and panels need; full rows are loaded on click.
+    df_full = load_data(h3_res, selected_year, columns=MAP_COLUMNS)
 
     # ── Prepare rendering layer ───────────────────────────────────────────────
     df_layer, was_sampled, mode_used = prepare_layer(
@@ -2601,6 +2864,11 @@ def main() -> None:
         max_hexes,
         mode=ss["view_mode"],
         snapshot_bounds=ss["snapshot_bounds"],
+        centres=(
+            cell_centres(h3_res, selected_year, columns=MAP_COLUMNS)
+            if ss["view_mode"] == "viewport_snapshot"
+            else None
+        ),
     )
 
     # ── Build GeoJSON + Folium map ────────────────────────────────────────────
@@ -2636,7 +2904,7 @@ def main() -> None:
         )
 
         with tab_map:
-            map_data = render_main(
+            render_main(
                 df_full,
                 folium_map,
                 was_sampled,
@@ -2,6 +2,6 @@
 Biodiversity & Infrastructure Report — Premium PDF generator.
 """
 
-from .build_report import build_report
+from .build_report import build_report, prefetch_map
 
-__all__ = ["build_report"]
+__all__ = ["build_report", "prefetch_map"]
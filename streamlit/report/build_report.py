@@ -10,14 +10,30 @@ from __future__ import annotations
 import io
 import math
 import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 import pandas as pd
+import requests
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.units import cm
+from reportlab.platypus import (
+    BaseDocTemplate,
+    Frame,
+    Image,
+    PageBreak,
+    PageTemplate,
+    Paragraph,
+    Spacer,
+)
 
 from . import charts, components, tables
-from .theme import DEFAULT_THEME, Theme
+from .theme import DEFAULT_THEME, Theme, hex_color
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -25,15 +41,12 @@ from .theme import DEFAULT_THEME, Theme
 # ─────────────────────────────────────────────────────────────────────────────
 
 
-def _latlon_to_tile(lat: float, lon: float, zoom: int) -> tuple[int, int]:
-    lat_rad = math.radians(lat)
-    n = 2.0**zoom
-    xtile = int((lon + 180.0) / 360.0 * n)
-    ytile = int(
-        (1.0 - math.log(math.tan(lat_rad) + 1.0 / math.cos(lat_rad)) / math.pi)
-        / 2.0 * n
-    )
-    return (xtile, ytile)
+@lru_cache(maxsize=4096)
+def _cell_latlng(h3_index: str) -> tuple[float, float]:
+    """H3 cell centre (lat, lng); memoized, the report asks for it more than once per cell."""
+    import h3
+
+    return h3.cell_to_latlng(h3_index)
 
 
 def _latlon_to_pixel(lat: float, lon: float, zoom: int, tx0: int, ty0: int, tile_size: int = 256) -> tuple[float, float]:
@@ -47,11 +60,123 @@ def _latlon_to_pixel(lat: float, lon: float, zoom: int, tx0: int, ty0: int, tile
     return (px, py)
 
 
-def _render_map_image(h3_index: str, width: int = 550, height: int = 380) -> bytes | None:
+# OSM tiles never change for our purposes; keep them on disk across sessions and
+# in memory within one (adjacent cells share most of their tile grid). Both are
+# small LRUs shared by every session and tile worker, hence the locks.
+TILE_CACHE_DIR = Path.home() / ".cache" / "biodiv_report" / "tiles"
+TILE_CACHE_MAX_FILES = 2000  # ~40 MB of PNG tiles
+TILE_PRUNE_EVERY = 64  # disk writes between size checks (the cap is soft in between)
+TILE_MEMO_MAX = 256
+_tile_memo: OrderedDict[tuple[int, int, int], bytes] = OrderedDict()
+_tile_lock = threading.Lock()
+_tile_prune_lock = threading.Lock()
+_tile_writes = 0
+
+
+def _prune_tile_cache() -> None:
+    """Trim the disk cache to TILE_CACHE_MAX_FILES, dropping the least recently used tiles."""
+    if not _tile_prune_lock.acquire(blocking=False):
+        return  # another thread is already pruning
+    try:
+        tiles = []
+        for path in TILE_CACHE_DIR.rglob("*.png"):
+            try:
+                tiles.append((path.stat().st_mtime, path))
+            except OSError:
+                pass
+        if len(tiles) <= TILE_CACHE_MAX_FILES:
+            return
+        tiles.sort()
+        for _, path in tiles[: len(tiles) - TILE_CACHE_MAX_FILES]:
+            path.unlink(missing_ok=True)
+    except OSError:
+        pass
+    finally:
+        _tile_prune_lock.release()
+
+
+def _get_tile(zoom: int, x: int, y: int) -> bytes | None:
+    """OSM tile PNG from the in-process memo, then the disk cache, then the network."""
+    global _tile_writes
+    key = (zoom, x, y)
+    with _tile_lock:
+        data = _tile_memo.get(key)
+        if data is not None:
+            _tile_memo.move_to_end(key)
+            return data
+    path = TILE_CACHE_DIR / str(zoom) / str(x) / f"{y}.png"
+    try:
+        data = path.read_bytes()
+    except OSError:
+        data = _fetch_tile(zoom, x, y)
+        if data is None:
+            return None  # failures are not cached; the next report retries
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(f".{threading.get_ident()}.tmp")
+            tmp.write_bytes(data)
+            tmp.replace(path)  # atomic: readers never see a partial tile
+            with _tile_lock:
+                _tile_writes += 1
+                prune = _tile_writes % TILE_PRUNE_EVERY == 1
+            if prune:
+                _prune_tile_cache()
+        except OSError:
+            pass  # read-only home etc.: just skip the disk cache
+    else:
+        try:
+            path.touch()  # mtime is the LRU clock for _prune_tile_cache
+        except OSError:
+            pass
+    with _tile_lock:
+        _tile_memo[key] = data
+        _tile_memo.move_to_end(key)
+        while len(_tile_memo) > TILE_MEMO_MAX:
+            _tile_memo.popitem(last=False)
+    return data
+
+
+# One keep-alive connection pool for all tile requests: the TLS handshake is paid
+# once per process, not once per tile
+_TILE_SESSION = requests.Session()
+_TILE_SESSION.headers.update({"User-Agent": "BiodiversityReport/1.0"})
+
+
+def _fetch_tile(zoom: int, x: int, y: int) -> bytes | None:
+    """Download one OSM tile PNG; None on any network error."""
+    url = f"https://tile.openstreetmap.org/{zoom}/{x}/{y}.png"
+    try:
+        resp = _TILE_SESSION.get(url, timeout=5)
+        resp.raise_for_status()
+        return resp.content
+    except Exception:
+        return None
+
+
+# The map is placed at MAP_IMAGE_CM in the PDF and rendered at that size (100 dpi),
+# so the PNG is embedded 1:1 with the same aspect ratio instead of being stretched
+MAP_IMAGE_CM = (14.0, 9.0)
+MAP_IMAGE_PX = tuple(round(c / 2.54 * 100) for c in MAP_IMAGE_CM)  # (551, 354)
+
+# Rendered map PNGs by (h3_index, width, height); only complete maps are kept
+MAP_MEMO_MAX = 128
+_map_memo: OrderedDict[tuple[str, int, int], bytes] = OrderedDict()
+_map_memo_lock = threading.Lock()
+
+
+def _render_map_image(h3_index: str, width: int = MAP_IMAGE_PX[0], height: int = MAP_IMAGE_PX[1]) -> bytes | None:
+    key = (h3_index, width, height)
+    cached = _map_memo.get(key)
+    if cached is not None:
+        return cached
     try:
         import h3
+    except ImportError:
+        return None
+    if not h3.is_valid_cell(h3_index):
+        return None  # nothing to draw: skip PIL and the tile fetches
+    try:
         from PIL import Image, ImageDraw
-        import urllib.request
     except ImportError:
         return None
     try:
@@ -69,56 +194,87 @@ def _render_map_image(h3_index: str, width: int = 550, height: int = 380) -> byt
                 lngs.append(plng)
         if not lats:
             return None
-        min_lat, max_lat = min(lats), max(lats)
-        min_lng, max_lng = min(lngs), max(lngs)
-        center_lat = (min_lat + max_lat) / 2
-        center_lng = (min_lng + max_lng) / 2
-        delta_lat = max_lat - min_lat
-        delta_lng = max_lng - min_lng
-        # Add 40% padding so hex fits with margin
-        span_lat = max(delta_lat * 1.4, 0.01)
-        span_lng = max(delta_lng * 1.4, 0.01)
-        # Pick highest zoom (most zoomed in) where 3x3 tiles still fit the hex
-        tiles_n = 3
+        # Pick the highest zoom (most zoomed in) at which the hex plus 40% padding
+        # fits the output size, then cut exactly width x height pixels out of the
+        # tile grid around it: tiles are pasted 1:1 and no resampling is needed
+        tile_size = 256
         zoom = 10
         for z in range(14, 5, -1):
-            nz = 2.0**z
-            deg_per = 360.0 / nz
-            if tiles_n * deg_per >= max(span_lat, span_lng):
+            pts = [_latlon_to_pixel(plat, plng, z, 0, 0, tile_size) for plat, plng in zip(lats, lngs)]
+            xs, ys = [p[0] for p in pts], [p[1] for p in pts]
+            if (max(xs) - min(xs)) * 1.4 <= width and (max(ys) - min(ys)) * 1.4 <= height:
                 zoom = z
                 break
-        tile_size = 256
-        tx, ty = _latlon_to_tile(center_lat, center_lng, zoom)
-        tx0 = tx - tiles_n // 2
-        ty0 = ty - tiles_n // 2
-        img_w = img_h = tile_size * tiles_n
-        canvas = Image.new("RGB", (img_w, img_h), (248, 248, 248))
-        for dx in range(tiles_n):
-            for dy in range(tiles_n):
-                txx, tyy = tx0 + dx, ty0 + dy
-                url = f"https://tile.openstreetmap.org/{zoom}/{txx}/{tyy}.png"
+        hex_px = [_latlon_to_pixel(plat, plng, zoom, 0, 0, tile_size) for plat, plng in zip(lats, lngs)]
+        xs, ys = [p[0] for p in hex_px], [p[1] for p in hex_px]
+        left = int(round((min(xs) + max(xs)) / 2 - width / 2))
+        top = int(round((min(ys) + max(ys)) / 2 - height / 2))
+
+        canvas = Image.new("RGB", (width, height), (248, 248, 248))
+        # Fetch the covering tiles concurrently: total wait is the slowest tile, not the sum
+        n_tiles = 2**zoom
+        tile_xy = [
+            (tx, ty)
+            for tx in range(left // tile_size, (left + width - 1) // tile_size + 1)
+            for ty in range(top // tile_size, (top + height - 1) // tile_size + 1)
+            if 0 <= ty < n_tiles
+        ]
+        with ThreadPoolExecutor(max_workers=len(tile_xy)) as ex:
+            tiles = ex.map(lambda t: _get_tile(zoom, t[0] % n_tiles, t[1]), tile_xy)
+            complete = True
+            for (tx, ty), data in zip(tile_xy, tiles):
+                if data is None:
+                    complete = False
+                    continue  # missing tile leaves the background; the rest still render
                 try:
-                    req = urllib.request.Request(url, headers={"User-Agent": "BiodiversityReport/1.0"})
-                    with urllib.request.urlopen(req, timeout=5) as resp:
-                        tile_img = Image.open(io.BytesIO(resp.read())).convert("RGB")
-                        canvas.paste(tile_img, (dx * tile_size, dy * tile_size))
+                    tile_img = Image.open(io.BytesIO(data)).convert("RGB")
+                    canvas.paste(tile_img, (tx * tile_size - left, ty * tile_size - top))
                 except Exception:
-                    pass
+                    complete = False
         draw = ImageDraw.Draw(canvas)
-        hex_xy = []
-        for plat, plng in zip(lats, lngs):
-            px, py = _latlon_to_pixel(plat, plng, zoom, tx0, ty0, tile_size)
-            hex_xy.append((px, py))
+        hex_xy = [(px - left, py - top) for px, py in hex_px]
         # Outline only, no fill — area inside stays visible
         draw.polygon(hex_xy, outline="#0d3b4c", fill=None, width=4)
-        canvas = canvas.resize((width, height), Image.Resampling.LANCZOS)
         buf = io.BytesIO()
         canvas.save(buf, format="PNG")
-        return buf.getvalue()
+        png = buf.getvalue()
+        if complete:  # a partial map is retried next time
+            with _map_memo_lock:
+                _map_memo[key] = png
+                while len(_map_memo) > MAP_MEMO_MAX:
+                    _map_memo.popitem(last=False)
+        return png
     except Exception:
         return None
 
 
+# Map renders started ahead of build_report by prefetch_map, keyed like _map_memo.
+# Tile downloads are network-bound, so they overlap with whatever the caller does next.
+# Shared by every Streamlit session, so all access goes through _map_pending_lock.
+MAP_PENDING_MAX = 8
+_map_pending: OrderedDict[tuple, Future] = OrderedDict()
+_map_pending_lock = threading.Lock()
+_map_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="report-map")
+
+
+def prefetch_map(h3_index: str) -> None:
+    """Start rendering the report map for h3_index in the background; build_report picks it up."""
+    key = (h3_index, *MAP_IMAGE_PX)
+    with _map_pending_lock:
+        if key in _map_memo or key in _map_pending:
+            return
+        while len(_map_pending) >= MAP_PENDING_MAX:  # prefetched but never built
+            _map_pending.popitem(last=False)
+        _map_pending[key] = _map_pool.submit(_render_map_image, h3_index)
+
+
+def _report_map_image(h3_index: str) -> bytes | None:
+    """The prefetched map if one was started, else render it now."""
+    with _map_pending_lock:
+        fut = _map_pending.pop((h3_index, *MAP_IMAGE_PX), None)
+    return fut.result() if fut is not None else _render_map_image(h3_index)
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # AI INSIGHTS PARSER
 # ─────────────────────────────────────────────────────────────────────────────
@@ -131,9 +287,6 @@ def _escape_html(text: str) -> str:
 
 
 def _parse_ai_insights(text: str, elements: list, styles: dict, make_table_fn) -> None:
-    from reportlab.lib.units import cm
-    from reportlab.platypus import Paragraph, Spacer
-
     lines = text.split("\n")
     i = 0
     while i < len(lines):
@@ -156,7 +309,7 @@ def _parse_ai_insights(text: str, elements: list, styles: dict, make_table_fn) -
             if table_rows:
                 col_count = len(table_rows[0])
                 col_widths = [16.0 / col_count] * col_count
-                elements.append(make_table_fn(table_rows, col_widths, "#0d3b4c"))
+                elements.append(make_table_fn(table_rows, col_widths, "#0d3b4c", fast=True))
                 elements.append(Spacer(1, 0.3 * cm))
             continue
         if stripped.startswith("- ") or stripped.startswith("• ") or (len(stripped) >= 2 and stripped[0].isdigit() and stripped[1] == "."):
@@ -184,6 +337,15 @@ def _parse_ai_insights(text: str, elements: list, styles: dict, make_table_fn) -
             elements.append(Spacer(1, 0.15 * cm))
 
 
+def _col(df: pd.DataFrame, col: str, default: Any = None) -> list:
+    """Column as a Python list (default per row if the column is missing), for row-free table building."""
+    return df[col].tolist() if col in df.columns else [default] * len(df)
+
+
+def _yes_dash(values: list) -> list[str]:
+    return ["Yes" if v else "—" for v in values]
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # MAIN BUILDER
 # ─────────────────────────────────────────────────────────────────────────────
@@ -206,20 +368,10 @@ def build_report(
     """
     Generate premium PDF report. Same signature as generate_report.
     """
-    from reportlab.lib import colors
-    from reportlab.lib.pagesizes import A4
-    from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
-    from reportlab.lib.units import cm
-    from reportlab.platypus import (
-        BaseDocTemplate,
-        Frame,
-        Image,
-        PageBreak,
-        PageTemplate,
-        Paragraph,
-        Spacer,
-        Table as RlTable,
-    )
+    # taxon_key is hashed by the groupby and drop_duplicates below; as a
+    # categorical that is done once here and the rest work on integer codes
+    if "taxon_key" in species_df.columns and species_df["taxon_key"].dtype == object:
+        species_df = species_df.assign(taxon_key=species_df["taxon_key"].astype("category"))
 
     theme = DEFAULT_THEME
     buf = io.BytesIO()
@@ -235,7 +387,7 @@ def build_report(
         components.draw_header_footer(canvas, doc, theme, h3_index, year_range)
         if confidential:
             canvas.saveState()
-            canvas.setFillColor(colors.HexColor("#e5e7eb"))
+            canvas.setFillColor(hex_color("#e5e7eb"))
             canvas.setFont(theme.font, 40)
             canvas.rotate(45)
             canvas.drawCentredString(page_w / 2, page_h / 2, "Confidential — Draft")
@@ -253,52 +405,21 @@ def build_report(
     )
     doc.addPageTemplates([template])
 
-    styles = getSampleStyleSheet()
-    c = theme.to_reportlab_colors()
-    custom_styles = {
-        "cover_title": ParagraphStyle(
-            "CoverTitle", parent=styles["Heading1"],
-            fontName=theme.font_bold, fontSize=theme.cover_title,
-            leading=int(theme.cover_title * 1.25), spaceAfter=theme.sm,
-            textColor=c["primary"], alignment=1,
-        ),
-        "cover_subtitle": ParagraphStyle(
-            "CoverSubtitle", parent=styles["Normal"],
-            fontName=theme.font, fontSize=theme.subhead,
-            leading=int(theme.subhead * 1.3), spaceAfter=theme.lg,
-            textColor=c["gray_500"], alignment=1,
-        ),
-        "section_h1": ParagraphStyle(
-            "SectionH1", parent=styles["Heading2"],
-            fontName=theme.font_bold, fontSize=theme.section_h1,
-            leading=int(theme.section_h1 * 1.25), spaceBefore=theme.lg, spaceAfter=theme.sm,
-            textColor=c["primary"], alignment=0,
-        ),
-        "body": ParagraphStyle(
-            "Body", parent=styles["Normal"],
-            fontName=theme.font, fontSize=theme.body,
-            leading=int(theme.body * 1.3), spaceAfter=theme.sm, alignment=0,
-        ),
-        "caption": ParagraphStyle(
-            "Caption", parent=styles["Normal"],
-            fontName=theme.font, fontSize=theme.footer,
-            leading=int(theme.footer * 1.25), spaceAfter=theme.xs,
-            textColor=c["gray_500"], alignment=0,
-        ),
-    }
+    custom_styles = components.get_styles(theme)
 
     elements = []
 
-    def _mt(data, widths, hdr, numeric=None):
-        return tables.make_table(data, widths, hdr, theme, numeric_cols=numeric or set(), align_right_cols=numeric or set())
+    def _mt(data, widths, hdr, numeric=None, fast=False):
+        return tables.make_table(
+            data, widths, hdr, theme, numeric_cols=numeric or set(), align_right_cols=numeric or set(), fast=fast
+        )
 
     # ── A) COVER PAGE ────────────────────────────────────────────────────────
     elements.append(Paragraph("Biodiversity & Infrastructure", custom_styles["cover_title"]))
     elements.append(Paragraph("Screening Report", custom_styles["cover_subtitle"]))
 
     try:
-        import h3
-        lat, lng = h3.cell_to_latlng(h3_index)
+        lat, lng = _cell_latlng(h3_index)
         loc_line = f"H3 cell {h3_index} · Resolution {h3_res} · {lat:.4f}°N, {lng:.4f}°E"
     except Exception:
         loc_line = f"H3 cell {h3_index} · Resolution {h3_res}"
@@ -307,15 +428,6 @@ def build_report(
         elements.append(Paragraph(f"<b>Industry:</b> {_escape_html(str(industry).strip())}", custom_styles["body"]))
     elements.append(Spacer(1, 0.3 * cm))
 
-    n_total = species_df["taxon_key"].nunique() if not species_df.empty else 0
-    n_threatened = (
-        species_df.loc[species_df["is_threatened"], "taxon_key"].nunique()
-        if not species_df.empty and "is_threatened" in species_df.columns else 0
-    )
-    n_invasive = (
-        species_df.loc[species_df["is_invasive"], "taxon_key"].nunique()
-        if not species_df.empty and "is_invasive" in species_df.columns else 0
-    )
     dqi_val = f"{cell_metrics['dqi']:.2f}" if cell_metrics is not None and "dqi" in cell_metrics.index and pd.notna(cell_metrics.get("dqi")) else "—"
 
     elements.append(Spacer(1, 0.5 * cm))
@@ -348,14 +460,14 @@ def build_report(
     # ── C) LOCATION & CONTEXT ────────────────────────────────────────────────
     elements.append(Paragraph("1. Location & Context", custom_styles["section_h1"]))
 
-    map_img = _render_map_image(h3_index)
+    map_img = _report_map_image(h3_index)
     if map_img:
-        elements.append(Image(io.BytesIO(map_img), width=14 * cm, height=9 * cm))
+        elements.append(Image(io.BytesIO(map_img), width=MAP_IMAGE_CM[0] * cm, height=MAP_IMAGE_CM[1] * cm))
         elements.append(Spacer(1, 0.3 * cm))
 
     try:
         import h3
-        lat, lng = h3.cell_to_latlng(h3_index)
+        lat, lng = _cell_latlng(h3_index)
         area_km2 = 0
         try:
             area_km2 = h3.cell_area(h3_index, unit="km^2")
@@ -377,28 +489,21 @@ def build_report(
     if species_df.empty:
         elements.append(Paragraph("No species data available for this cell.", custom_styles["body"]))
     else:
-        agg_df = species_df.groupby("taxon_key", as_index=False).agg(
-            {name_col: "first", "occurrence_count": "sum"}
-        )
-        if "is_threatened" in species_df.columns:
-            agg_df = agg_df.merge(
-                species_df[["taxon_key", "is_threatened"]].drop_duplicates("taxon_key"),
-                on="taxon_key", how="left",
-            )
-        if "is_invasive" in species_df.columns:
-            agg_df = agg_df.merge(
-                species_df[["taxon_key", "is_invasive"]].drop_duplicates("taxon_key"),
-                on="taxon_key", how="left",
-            )
+        # One groupby pass folds in the per-species flags (no follow-up merges)
+        agg_spec = {name_col: "first", "occurrence_count": "sum"}
+        for flag in ("is_threatened", "is_invasive"):
+            if flag in species_df.columns:
+                agg_spec[flag] = "first"
+        agg_df = species_df.groupby("taxon_key", as_index=False, observed=True).agg(agg_spec)
 
         top20 = agg_df.nlargest(20, "occurrence_count")
         top_data = [["Species", "Occurrences", "Threatened", "Invasive"]]
-        for _, row in top20.iterrows():
-            name = str(row.get(name_col, "?"))[:45]
-            occ = int(row.get("occurrence_count", 0))
-            thr = "Yes" if row.get("is_threatened") else "—"
-            inv = "Yes" if row.get("is_invasive") else "—"
-            top_data.append([name, occ, thr, inv])
+        top_data += map(list, zip(
+            [str(v)[:45] for v in _col(top20, name_col, "?")],
+            [int(v) for v in _col(top20, "occurrence_count", 0)],
+            _yes_dash(_col(top20, "is_threatened")),
+            _yes_dash(_col(top20, "is_invasive")),
+        ))
         elements.append(Paragraph("<b>Top 20 species by occurrence count</b>", custom_styles["body"]))
         elements.append(_mt(top_data, [8, 2.5, 2, 2], theme.primary_light, {1}))
         elements.append(components.spacer(0.5))
@@ -406,16 +511,19 @@ def build_report(
     # ── E) THREATENED & INVASIVE ──────────────────────────────────────────────
     elements.append(Paragraph("3. Threatened & Invasive Species", custom_styles["section_h1"]))
 
+    # Flags are per species, so both subsets are cut from one deduplicated frame
+    species_first = species_df.drop_duplicates("taxon_key") if not species_df.empty else species_df
+
     if not species_df.empty and "is_threatened" in species_df.columns:
-        threatened = species_df[species_df["is_threatened"]].drop_duplicates("taxon_key")
+        threatened = species_first[species_first["is_threatened"]]
         if not threatened.empty:
             thr_data = [["Species", "Occurrences", "IUCN", "Invasive"]]
-            for _, row in threatened.iterrows():
-                name = str(row.get(name_col, "?"))[:45]
-                occ = int(row.get("occurrence_count", 0))
-                iucn = str(row.get("iucn_category", "—")) if pd.notna(row.get("iucn_category")) else "—"
-                inv = "Yes" if row.get("is_invasive") else "—"
-                thr_data.append([name, occ, iucn, inv])
+            thr_data += map(list, zip(
+                [str(v)[:45] for v in _col(threatened, name_col, "?")],
+                [int(v) for v in _col(threatened, "occurrence_count", 0)],
+                [str(v) if pd.notna(v) else "—" for v in _col(threatened, "iucn_category")],
+                _yes_dash(_col(threatened, "is_invasive")),
+            ))
             elements.append(Paragraph("<b>Threatened species (IUCN CR/EN/VU)</b>", custom_styles["body"]))
             elements.append(tables.make_iucn_table(thr_data, [8, 2.5, 2, 2], 2, theme))
             elements.append(components.spacer(0.3))
@@ -426,12 +534,13 @@ def build_report(
                 "<i>Disclaimer: IUCN text may be truncated for readability.</i>",
                 custom_styles["caption"],
             ))
-            for _, row in threatened.head(10).iterrows():
-                name = row.get(name_col, "?")
-                iucn = row.get("iucn_category", "")
-                rationale = row.get("rationale")
+            top10 = threatened.head(10)
+            for name, iucn, rationale in zip(
+                _col(top10, name_col, "?"), _col(top10, "iucn_category", ""), _col(top10, "rationale")
+            ):
                 if rationale and pd.notna(rationale):
-                    txt = str(rationale)[:400].replace("\n", " ") + ("…" if len(str(rationale)) > 400 else "")
+                    r = str(rationale)
+                    txt = r[:400].replace("\n", " ") + ("…" if len(r) > 400 else "")
                 else:
                     txt = "No rationale available."
                 elements.append(Paragraph(
@@ -441,15 +550,15 @@ def build_report(
                 elements.append(Spacer(1, 0.15 * cm))
 
     if not species_df.empty and "is_invasive" in species_df.columns:
-        invasive = species_df[species_df["is_invasive"]].drop_duplicates("taxon_key")
+        invasive = species_first[species_first["is_invasive"]]
         if not invasive.empty:
             elements.append(Paragraph("<b>Invasive species</b>", custom_styles["body"]))
             inv_data = [["Species", "Occurrences", "Threatened"]]
-            for _, row in invasive.iterrows():
-                name = str(row.get(name_col, "?"))[:45]
-                occ = int(row.get("occurrence_count", 0))
-                thr = "Yes" if row.get("is_threatened") else "—"
-                inv_data.append([name, occ, thr])
+            inv_data += map(list, zip(
+                [str(v)[:45] for v in _col(invasive, name_col, "?")],
+                [int(v) for v in _col(invasive, "occurrence_count", 0)],
+                _yes_dash(_col(invasive, "is_threatened")),
+            ))
             elements.append(_mt(inv_data, [8, 2.5, 2], "#d97706", {1}))
 
     elements.append(PageBreak())
@@ -467,7 +576,7 @@ def build_report(
                 elements.append(Paragraph(f"<b>{table_title}</b>", custom_styles["body"]))
                 col_count = len(table_rows[0])
                 col_widths = [16.0 / col_count] * col_count
-                elements.append(_mt(table_rows, col_widths, theme.primary_light, {1, 2} if col_count > 2 else {1}))
+                elements.append(_mt(table_rows, col_widths, theme.primary_light, {1, 2} if col_count > 2 else {1}, fast=True))
                 elements.append(Spacer(1, 0.3 * cm))
         if temporal_artifacts.get("narrative_text"):
             for line in temporal_artifacts["narrative_text"].split("\n"):
@@ -494,36 +603,17 @@ def build_report(
         if pd.notna(elev) or pd.notna(slope):
             elements.append(Spacer(1, 0.2 * cm))
 
-        gee_pie = charts.render_gee_land_cover_pie(gee)
-        if gee_pie:
+        gee_pie = charts.gee_land_cover_pie(gee)
+        if gee_pie is not None:
             elements.append(Paragraph("<b>Land cover (Copernicus 100m)</b>", custom_styles["body"]))
-            elements.append(Image(io.BytesIO(gee_pie), width=14 * cm, height=9 * cm))
+            elements.append(gee_pie)
             elements.append(Spacer(1, 0.3 * cm))
 
-        lc_items = []
-        cols_iter = sorted(gee.keys()) if isinstance(gee, dict) else sorted(gee.index)
-        for col in cols_iter:
-            if not (str(col).startswith("lc_") and str(col).endswith("_pct")):
-                continue
-            val = gee.get(col, None) if isinstance(gee, dict) else gee.get(col, None)
-            if val is None or (hasattr(val, "__float__") and float(val) <= 0):
-                continue
-            try:
-                pct = float(val) * 100
-            except (TypeError, ValueError):
-                continue
-            cid_str = str(col).replace("lc_", "").replace("_pct", "")
-            try:
-                cid = int(cid_str)
-                label = charts.GEE_LC_LABELS.get(cid, col)
-            except ValueError:
-                label = col
-            lc_items.append((label, f"{pct:.1f}%", pct))
-        lc_items.sort(key=lambda x: -x[2])
+        lc_items = charts.gee_land_cover_items(gee)
         if lc_items:
-            lc_data = [["Land cover type", "%"]] + [[l, p] for l, p, _ in lc_items]
+            lc_data = [["Land cover type", "%"]] + [[l, f"{p:.1f}%"] for l, p in lc_items]
             elements.append(Paragraph("<b>Land cover breakdown</b>", custom_styles["body"]))
-            elements.append(_mt(lc_data, [10, 3], theme.primary_light, {1}))
+            elements.append(_mt(lc_data, [10, 3], theme.primary_light, {1}, fast=True))
     else:
         elements.append(Paragraph("No GEE terrain data available for this cell.", custom_styles["body"]))
 
@@ -566,7 +656,7 @@ def build_report(
             infra_rows.append([label, str(val)])
     if infra_rows:
         infra_data = [["Infrastructure", "Value"]] + infra_rows
-        elements.append(_mt(infra_data, [10, 2], theme.success, {1}))
+        elements.append(_mt(infra_data, [10, 2], theme.success, {1}, fast=True))
     else:
         elements.append(Paragraph("No OSM infrastructure data for this cell.", custom_styles["body"]))
 
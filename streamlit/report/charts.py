@@ -1,13 +1,24 @@
 """
-Styled matplotlib charts for PDF — clean, consultancy-grade.
+Styled charts for PDF — clean, consultancy-grade.
 White background, light grid, consistent colors, readable fonts.
+Line/bar charts are matplotlib PNGs; the land cover pie is a ReportLab vector Drawing.
 """
 
 from __future__ import annotations
 
 import io
+from functools import lru_cache
 from typing import Any
 
+import numpy as np
+import pandas as pd
+from reportlab.graphics.charts.piecharts import Pie
+from reportlab.graphics.shapes import Drawing, String
+from reportlab.lib import colors
+from reportlab.lib.units import cm
+
+from .theme import hex_color
+
 # Chart color palette — grayscale + one accent (max 4 colors)
 CHART_COLORS = ["#4a4a4a", "#6b7280", "#9ca3af", "#0d3b4c"]  # gray, gray, gray, accent
 CHART_ACCENT = "#0d3b4c"
@@ -15,10 +26,21 @@ CHART_RISK = "#b91c1c"
 CHART_WARNING = "#d97706"
 
 
+@lru_cache(maxsize=1)
+def _pyplot():
+    """matplotlib.pyplot on the Agg backend, imported and configured once; None if not installed."""
+    try:
+        import matplotlib
+        matplotlib.use("Agg")
+        import matplotlib.pyplot as plt
+    except ImportError:
+        return None
+    return plt
+
+
 def _apply_style(ax, fig):
     """Apply consistent styling to matplotlib axes."""
-    import matplotlib.pyplot as plt
-
+    plt = _pyplot()
     ax.set_facecolor("white")
     fig.patch.set_facecolor("white")
     ax.grid(True, alpha=0.25, linestyle="-")
@@ -31,13 +53,6 @@ def _apply_style(ax, fig):
 
 def render_land_cover_bar(osm_row: Any, width: int = 500, height: int = 300) -> bytes | None:
     """Horizontal bar chart of land cover % (ranked) — cleaner than pie."""
-    try:
-        import matplotlib
-        matplotlib.use("Agg")
-        import matplotlib.pyplot as plt
-    except ImportError:
-        return None
-
     pct_cols = [
         ("waterbody_area_pct", "Waterbody"),
         ("waterway_area_pct", "Waterway"),
@@ -55,19 +70,21 @@ def render_land_cover_bar(osm_row: Any, width: int = 500, height: int = 300) ->
         ("restricted_area_pct", "Restricted"),
     ]
 
-    items: list[tuple[str, float]] = []
-    for col, label in pct_cols:
-        if col in osm_row.index:
-            val = osm_row.get(col)
-            if val is not None and hasattr(val, "__float__") and float(val) > 0:
-                items.append((label, min(float(val), 100.0)))
-
-    if not items:
+    # One reindex + mask instead of a .get()/float() per column
+    vals = pd.to_numeric(osm_row.reindex([c for c, _ in pct_cols]), errors="coerce").to_numpy(
+        dtype=float, na_value=np.nan
+    )
+    idx = np.flatnonzero(np.isfinite(vals) & (vals > 0))
+    if not len(idx):
+        return None  # empty hex: nothing to chart, matplotlib is never loaded
+    plt = _pyplot()
+    if plt is None:
         return None
 
-    items.sort(key=lambda x: x[1], reverse=True)
-    labels = [x[0] for x in items[:12]]
-    values = [x[1] for x in items[:12]]
+    pcts = np.minimum(vals[idx], 100.0)
+    order = np.argsort(-pcts, kind="stable")[:12]
+    labels = [pct_cols[idx[i]][1] for i in order]
+    values = pcts[order].tolist()
 
     fig, ax = plt.subplots(figsize=(width / 100, height / 100), dpi=100)
     y_pos = range(len(labels))
@@ -87,16 +104,12 @@ def render_land_cover_bar(osm_row: Any, width: int = 500, height: int = 300) ->
 
 def render_observation_pressure(years: list[int], obs_by_year: dict[int, int], width: int = 500, height: int = 220) -> bytes | None:
     """Line chart: observation pressure over time."""
-    try:
-        import matplotlib
-        matplotlib.use("Agg")
-        import matplotlib.pyplot as plt
-    except ImportError:
-        return None
-
     vals = [obs_by_year.get(y, 0) for y in years]
     if not vals:
         return None
+    plt = _pyplot()
+    if plt is None:
+        return None
 
     fig, ax = plt.subplots(figsize=(width / 100, height / 100), dpi=100)
     ax.plot(years, vals, "o-", color=CHART_ACCENT, linewidth=2, markersize=6)
@@ -114,17 +127,13 @@ def render_observation_pressure(years: list[int], obs_by_year: dict[int, int], w
 
 def render_richness_threatened(years: list[int], richness_by_year: dict, threatened_by_year: dict, width: int = 500, height: int = 220) -> bytes | None:
     """Two lines: richness + threatened count."""
-    try:
-        import matplotlib
-        matplotlib.use("Agg")
-        import matplotlib.pyplot as plt
-    except ImportError:
-        return None
-
     r_vals = [richness_by_year.get(y, 0) for y in years]
     t_vals = [threatened_by_year.get(y, 0) for y in years]
     if not r_vals and not t_vals:
         return None
+    plt = _pyplot()
+    if plt is None:
+        return None
 
     fig, ax = plt.subplots(figsize=(width / 100, height / 100), dpi=100)
     ax.plot(years, r_vals, "o-", color=CHART_COLORS[0], linewidth=2, label="Species richness")
@@ -169,75 +178,82 @@ GEE_LC_LABELS: dict[int, str] = {
 }
 
 
-def render_gee_land_cover_pie(gee_row: Any, width: int = 500, height: int = 320, top_n: int = 4) -> bytes | None:
-    """Pie chart of Copernicus land cover % (GEE terrain). Top N types + Others."""
+def _gee_lc_label(col: str) -> str:
+    """lc_<class id>_pct column -> Copernicus class label (the column name if unknown)."""
     try:
-        import matplotlib
-        matplotlib.use("Agg")
-        import matplotlib.pyplot as plt
-    except ImportError:
-        return None
-
-    items: list[tuple[str, float]] = []
-    cols = sorted(gee_row.keys()) if isinstance(gee_row, dict) else sorted(gee_row.index)
-    for col in cols:
-        if not (str(col).startswith("lc_") and str(col).endswith("_pct")):
-            continue
-        val = gee_row.get(col, None) if isinstance(gee_row, dict) else gee_row.get(col, None)
-        if val is None or (hasattr(val, "__float__") and float(val) <= 0):
-            continue
-        try:
-            pct = min(float(val) * 100, 100.0)
-        except (TypeError, ValueError):
-            continue
-        cid_str = str(col).replace("lc_", "").replace("_pct", "")
-        try:
-            cid = int(cid_str)
-            label = GEE_LC_LABELS.get(cid, col)
-        except ValueError:
-            label = col
-        items.append((label, pct))
-
+        return GEE_LC_LABELS.get(int(col.replace("lc_", "").replace("_pct", "")), col)
+    except ValueError:
+        return col
+
+
+def gee_land_cover_items(gee_row: Any) -> list[tuple[str, float]]:
+    """
+    (label, % of hex) for every positive lc_<class>_pct value of a GEE terrain row
+    (dict or Series, fractions 0–1), largest first. One vectorised pass over the columns.
+    """
+    row = pd.Series(gee_row, dtype=object) if isinstance(gee_row, dict) else gee_row
+    cols = sorted(str(c) for c in row.index if str(c).startswith("lc_") and str(c).endswith("_pct"))
+    if not cols:
+        return []
+    vals = pd.to_numeric(row.reindex(cols), errors="coerce").to_numpy(dtype=float, na_value=np.nan)
+    idx = np.flatnonzero(np.isfinite(vals) & (vals > 0))
+    pcts = np.minimum(vals[idx] * 100, 100.0)
+    order = np.argsort(-pcts, kind="stable")
+    return [(_gee_lc_label(cols[idx[i]]), float(pcts[i])) for i in order]
+
+
+def gee_land_cover_pie(gee_row: Any, width_cm: float = 14.0, height_cm: float = 9.0, top_n: int = 4) -> Any | None:
+    """
+    Pie chart of Copernicus land cover % (GEE terrain). Top N types + Others.
+    Returned as a ReportLab Drawing flowable: drawn as vectors into the PDF,
+    no matplotlib figure or PNG round-trip.
+    """
+    items = gee_land_cover_items(gee_row)
     if not items:
         return None
 
-    items.sort(key=lambda x: x[1], reverse=True)
     # Top N + Others
     top_items = items[:top_n]
     others_sum = sum(x[1] for x in items[top_n:])
     if others_sum > 0:
         top_items.append(("Others", others_sum))
-    labels = [x[0] for x in top_items]
-    values = [x[1] for x in top_items]
 
-    fig, ax = plt.subplots(figsize=(width / 100, height / 100), dpi=100)
-    colors = [CHART_COLORS[i % len(CHART_COLORS)] for i in range(len(labels))]
-    wedges, texts, autotexts = ax.pie(values, labels=labels, autopct="%1.1f%%", colors=colors, startangle=90)
-    for t in texts:
-        t.set_fontsize(8)
-    for t in autotexts:
-        t.set_fontsize(7)
-    ax.set_title("Land cover (Copernicus 100m)", fontsize=12, fontweight="bold")
-    _apply_style(ax, fig)
-    plt.tight_layout()
-    buf = io.BytesIO()
-    plt.savefig(buf, format="PNG", bbox_inches="tight", dpi=100, facecolor="white")
-    plt.close()
-    return buf.getvalue()
+    width, height = width_cm * cm, height_cm * cm
+    title_h = 0.9 * cm
+    diameter = height - title_h - 0.8 * cm
+    d = Drawing(width, height)
+    d.add(String(
+        width / 2, height - 0.6 * cm, "Land cover (Copernicus 100m)",
+        fontName="Helvetica-Bold", fontSize=12, textAnchor="middle",
+    ))
+
+    pie = Pie()
+    pie.x = (width - diameter) / 2
+    pie.y = 0.4 * cm
+    pie.width = pie.height = diameter
+    pie.data = [v for _, v in top_items]
+    pie.labels = [f"{label} {v:.1f}%" for label, v in top_items]
+    pie.startAngle = 90
+    pie.direction = "anticlockwise"
+    pie.sideLabels = True
+    pie.slices.fontName = "Helvetica"
+    pie.slices.fontSize = 8
+    pie.slices.strokeColor = colors.white
+    pie.slices.strokeWidth = 0.5
+    for i in range(len(top_items)):
+        pie.slices[i].fillColor = hex_color(CHART_COLORS[i % len(CHART_COLORS)])
+    d.add(pie)
+    return d
 
 
 def render_dqi_over_time(years: list[int], dqi_by_year: dict, width: int = 500, height: int = 220) -> bytes | None:
     """Line chart: DQI over time."""
-    try:
-        import matplotlib
-        matplotlib.use("Agg")
-        import matplotlib.pyplot as plt
-    except ImportError:
-        return None
-
     vals = [dqi_by_year.get(y, 0) for y in years]
     if not vals:
         return None
+    plt = _pyplot()
+    if plt is None:
+        return None
 
     fig, ax = plt.subplots(figsize=(width / 100, height / 100), dpi=100)
     ax.plot(years, vals, "o-", color=CHART_ACCENT, linewidth=2, markersize=6)
@@ -4,15 +4,24 @@ Reusable PDF components: header, footer, section titles, KPI cards, callouts.
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Any
 
-from .theme import DEFAULT_THEME, Theme
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+from reportlab.lib.units import cm
+from reportlab.platypus import Paragraph, Spacer, Table, TableStyle
 
+from .theme import DEFAULT_THEME, Theme, hex_color
 
-def _get_styles(theme: Theme):
-    """Build ReportLab paragraph styles from theme."""
-    from reportlab.lib import colors
-    from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+
+@lru_cache(maxsize=8)
+def get_styles(theme: Theme) -> dict[str, ParagraphStyle]:
+    """
+    Build ReportLab paragraph styles from theme.
+    Cached per theme and shared between documents: treat the dict and styles as read-only.
+    """
 
     styles = getSampleStyleSheet()
     c = theme.to_reportlab_colors()
@@ -92,9 +101,6 @@ def _get_styles(theme: Theme):
 
 def draw_header_footer(canvas, doc, theme: Theme, h3_index: str, year_range: str):
     """Draw header (top bar) and footer on every page."""
-    from reportlab.lib import colors
-    from reportlab.lib.pagesizes import A4
-    from reportlab.lib.units import cm
 
     page_w, page_h = A4
     margin = theme.md / 72 * 2.54 * 10  # approx
@@ -105,7 +111,7 @@ def draw_header_footer(canvas, doc, theme: Theme, h3_index: str, year_range: str
     canvas.saveState()
 
     # Footer bar
-    canvas.setFillColor(colors.HexColor(theme.primary))
+    canvas.setFillColor(hex_color(theme.primary))
     canvas.rect(0, 0, page_w, footer_h, fill=1, stroke=0)
     canvas.setFillColor(colors.white)
     canvas.setFont(theme.font, theme.footer)
@@ -113,7 +119,7 @@ def draw_header_footer(canvas, doc, theme: Theme, h3_index: str, year_range: str
     canvas.drawRightString(page_w - margin_cm, 0.35 * cm, f"Page {doc.page}")
 
     # Header line (subtle)
-    canvas.setStrokeColor(colors.HexColor(getattr(theme, "gray_300", "#d1d5db")))
+    canvas.setStrokeColor(hex_color(getattr(theme, "gray_300", "#d1d5db")))
     canvas.setLineWidth(0.5)
     canvas.line(margin_cm, page_h - header_h, page_w - margin_cm, page_h - header_h)
 
@@ -122,20 +128,16 @@ def draw_header_footer(canvas, doc, theme: Theme, h3_index: str, year_range: str
 
 def section_title(text: str, theme: Theme = DEFAULT_THEME):
     """Section H1 with consistent styling."""
-    from reportlab.platypus import Paragraph
 
-    styles = _get_styles(theme)
+    styles = get_styles(theme)
     return Paragraph(text, styles["section_h1"])
 
 
 def kpi_card(label: str, value: str, theme: Theme = DEFAULT_THEME, accent: bool = True):
     """Single KPI card (label + value) for at-a-glance row."""
-    from reportlab.lib import colors
-    from reportlab.lib.units import cm
-    from reportlab.platypus import Table, TableStyle
 
-    bg = colors.HexColor(theme.primary) if accent else colors.HexColor(theme.gray_100)
-    fg = colors.white if accent else colors.HexColor(theme.gray_900)
+    bg = hex_color(theme.primary) if accent else hex_color(theme.gray_100)
+    fg = colors.white if accent else hex_color(theme.gray_900)
 
     t = Table([[label, value]], colWidths=[4 * cm, 2.5 * cm])
     t.setStyle(TableStyle([
@@ -157,19 +159,15 @@ def kpi_card(label: str, value: str, theme: Theme = DEFAULT_THEME, accent: bool
 
 def callout_box(title: str, bullets: list[str], theme: Theme = DEFAULT_THEME, box_type: str = "info"):
     """Callout box with title + bullet list. box_type: info, warning, risk."""
-    from reportlab.lib import colors
-    from reportlab.lib.units import cm
-    from reportlab.platypus import Paragraph, Table, TableStyle
 
     colors_map = {"info": theme.primary_light, "warning": theme.warning, "risk": theme.risk}
-    border_color = colors.HexColor(colors_map.get(box_type, theme.primary_light))
+    border_color = hex_color(colors_map.get(box_type, theme.primary_light))
 
-    styles = _get_styles(theme)
+    styles = get_styles(theme)
     content = [Paragraph(f"<b>{title}</b>", styles["subhead"])]
     for b in bullets:
         content.append(Paragraph(f"• {b}", styles["body"]))
 
-    from reportlab.platypus import Table
     inner = Table([[c] for c in content], colWidths=[14 * cm])
     inner.setStyle(TableStyle([
         ("LEFTPADDING", (0, 0), (-1, -1), 10),
@@ -181,26 +179,21 @@ def callout_box(title: str, bullets: list[str], theme: Theme = DEFAULT_THEME, bo
     wrapper = Table([[inner]], colWidths=[15 * cm])
     wrapper.setStyle(TableStyle([
         ("BOX", (0, 0), (-1, -1), 1, border_color),
-        ("BACKGROUND", (0, 0), (-1, -1), colors.HexColor(theme.gray_100)),
+        ("BACKGROUND", (0, 0), (-1, -1), hex_color(theme.gray_100)),
     ]))
     return wrapper
 
 
 def divider(theme: Theme = DEFAULT_THEME):
     """Thin horizontal divider line."""
-    from reportlab.lib import colors
-    from reportlab.lib.units import cm
-    from reportlab.platypus import Table, TableStyle
 
     t = Table([[""]], colWidths=[16 * cm], rowHeights=[0.12 * cm])
     t.setStyle(TableStyle([
-        ("BACKGROUND", (0, 0), (-1, -1), colors.HexColor(theme.primary)),
+        ("BACKGROUND", (0, 0), (-1, -1), hex_color(theme.primary)),
     ]))
     return t
 
 
 def spacer(height_cm: float = 0.5):
     """Vertical spacer."""
-    from reportlab.lib.units import cm
-    from reportlab.platypus import Spacer
     return Spacer(1, height_cm * cm)
@@ -4,9 +4,14 @@ Table renderer: zebra rows, aligned numbers, IUCN badges, fixed column widths.
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Any
 
-from .theme import DEFAULT_THEME, Theme, IUCN_CR, IUCN_EN, IUCN_VU, IUCN_NT, IUCN_LC, IUCN_DD
+from reportlab.lib import colors
+from reportlab.lib.units import cm
+from reportlab.platypus import Flowable, Table, TableStyle
+
+from .theme import DEFAULT_THEME, Theme, hex_color, IUCN_CR, IUCN_EN, IUCN_VU, IUCN_NT, IUCN_LC, IUCN_DD
 
 
 def _iucn_badge_color(cat: str) -> str:
@@ -27,6 +32,102 @@ def _iucn_badge_color(cat: str) -> str:
     return "#6b7280"
 
 
+@lru_cache(maxsize=16)
+def _base_table_cmds(
+    font_bold: str, table_text: int, gray_900: str, gray_100: str, gray_300: str
+) -> tuple[tuple, ...]:
+    """make_table style commands shared by every table of a theme (all but the header colour)."""
+    return (
+        ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
+        ("FONTNAME", (0, 0), (-1, 0), font_bold),
+        ("FONTSIZE", (0, 0), (-1, 0), table_text + 1),
+        ("BOTTOMPADDING", (0, 0), (-1, 0), 8),
+        ("TOPPADDING", (0, 0), (-1, 0), 8),
+        ("BACKGROUND", (0, 1), (-1, -1), colors.white),
+        ("TEXTCOLOR", (0, 1), (-1, -1), hex_color(gray_900)),
+        ("FONTSIZE", (0, 1), (-1, -1), table_text),
+        ("ROWBACKGROUNDS", (0, 1), (-1, -1), [colors.white, hex_color(gray_100)]),
+        ("GRID", (0, 0), (-1, -1), 0.5, hex_color(gray_300)),
+        ("LEFTPADDING", (0, 0), (-1, -1), 8),
+        ("RIGHTPADDING", (0, 0), (-1, -1), 8),
+        ("TOPPADDING", (0, 0), (-1, -1), 5),
+        ("BOTTOMPADDING", (0, 0), (-1, -1), 5),
+    )
+
+
+# make_table(fast=True) output up to this many body rows is drawn by FastTable instead of Table
+FAST_TABLE_MAX_ROWS = 16
+# Row geometry of a single-line make_table row: Table's default 12pt leading + 5pt padding
+_ROW_LEADING = 12
+_CELL_PAD_V = 5
+_CELL_PAD_H = 8
+
+
+class FastTable(Flowable):
+    """
+    make_table look-alike drawn straight onto the canvas: one rect per row, one
+    drawString per cell. Skips Table's per-cell style resolution and layout passes,
+    but rows are single-line and it never splits across pages — short tables only.
+    """
+
+    def __init__(
+        self,
+        rows: list[list[str]],
+        col_widths: list[float],
+        header_color: str,
+        theme: Theme,
+        align_right_cols: set[int],
+    ):
+        super().__init__()
+        self.hAlign = "CENTER"  # like Table
+        self.rows = rows
+        self.col_widths = col_widths
+        self.header_color = header_color
+        self.theme = theme
+        self.align_right_cols = align_right_cols
+        self.row_h = _ROW_LEADING + 2 * _CELL_PAD_V
+        self.width = sum(col_widths)
+        self.height = self.row_h * len(rows)
+
+    def wrap(self, availWidth, availHeight):
+        return self.width, self.height
+
+    def draw(self):
+        c = self.canv
+        theme = self.theme
+        row_h, width, height = self.row_h, self.width, self.height
+        xs = [0.0]
+        for w in self.col_widths:
+            xs.append(xs[-1] + w)
+
+        # Row backgrounds: header, then white/gray_100 zebra
+        stripe = hex_color(theme.gray_100)
+        c.setFillColor(hex_color(self.header_color))
+        c.rect(0, height - row_h, width, row_h, stroke=0, fill=1)
+        for ri in range(2, len(self.rows), 2):
+            c.setFillColor(stripe)
+            c.rect(0, height - (ri + 1) * row_h, width, row_h, stroke=0, fill=1)
+
+        c.setStrokeColor(hex_color(getattr(theme, "gray_300", "#d1d5db")))
+        c.setLineWidth(0.5)
+        c.lines(
+            [(0, ri * row_h, width, ri * row_h) for ri in range(len(self.rows) + 1)]
+            + [(x, 0, x, height) for x in xs]
+        )
+
+        for ri, row in enumerate(self.rows):
+            if ri < 2:  # header font, then the body font (Table's default Helvetica) for the rest
+                size = theme.table_text + 1 if ri == 0 else theme.table_text
+                c.setFont(theme.font_bold if ri == 0 else "Helvetica", size)
+                c.setFillColor(colors.white if ri == 0 else hex_color(theme.gray_900))
+            y = height - (ri + 1) * row_h + _CELL_PAD_V + _ROW_LEADING - size
+            for ci, cell in enumerate(row):
+                if ci in self.align_right_cols:
+                    c.drawRightString(xs[ci + 1] - _CELL_PAD_H, y, cell)
+                else:
+                    c.drawString(xs[ci] + _CELL_PAD_H, y, cell)
+
+
 def make_table(
     data: list[list[Any]],
     col_widths: list[float],
@@ -34,16 +135,16 @@ def make_table(
     theme: Theme = DEFAULT_THEME,
     numeric_cols: set[int] | None = None,
     align_right_cols: set[int] | None = None,
+    fast: bool = False,
 ) -> Any:
     """
     Build ReportLab Table with zebra striping, header, aligned numbers.
 
     numeric_cols: 0-based indices for columns that should be right-aligned and formatted
     align_right_cols: 0-based indices for right alignment (numbers, counts)
+    fast: draw with FastTable when the table is short enough; only for tables with
+        short single-line cells that never need to split across pages
     """
-    from reportlab.lib import colors
-    from reportlab.lib.units import cm
-    from reportlab.platypus import Table, TableStyle
 
     numeric_cols = numeric_cols or set()
     align_right_cols = align_right_cols or set()
@@ -71,23 +172,23 @@ def make_table(
                 new_row.append(str(cell)[:50] + ("…" if len(str(cell)) > 50 else ""))
         formatted.append(new_row)
 
+    if fast and len(formatted) - 1 <= FAST_TABLE_MAX_ROWS and all(
+        len(row) == len(col_widths) and not any("\n" in cell for cell in row) for row in formatted
+    ):
+        return FastTable(
+            formatted, [w * cm for w in col_widths], header_color, theme, align_right_cols | numeric_cols
+        )
+
     t = Table(formatted, colWidths=[w * cm for w in col_widths])
     style = [
-        ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor(header_color)),
-        ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
-        ("FONTNAME", (0, 0), (-1, 0), theme.font_bold),
-        ("FONTSIZE", (0, 0), (-1, 0), theme.table_text + 1),
-        ("BOTTOMPADDING", (0, 0), (-1, 0), 8),
-        ("TOPPADDING", (0, 0), (-1, 0), 8),
-        ("BACKGROUND", (0, 1), (-1, -1), colors.white),
-        ("TEXTCOLOR", (0, 1), (-1, -1), colors.HexColor(theme.gray_900)),
-        ("FONTSIZE", (0, 1), (-1, -1), theme.table_text),
-        ("ROWBACKGROUNDS", (0, 1), (-1, -1), [colors.white, colors.HexColor(theme.gray_100)]),
-        ("GRID", (0, 0), (-1, -1), 0.5, colors.HexColor(getattr(theme, "gray_300", "#d1d5db"))),
-        ("LEFTPADDING", (0, 0), (-1, -1), 8),
-        ("RIGHTPADDING", (0, 0), (-1, -1), 8),
-        ("TOPPADDING", (0, 0), (-1, -1), 5),
-        ("BOTTOMPADDING", (0, 0), (-1, -1), 5),
+        ("BACKGROUND", (0, 0), (-1, 0), hex_color(header_color)),
+        *_base_table_cmds(
+            theme.font_bold,
+            theme.table_text,
+            theme.gray_900,
+            theme.gray_100,
+            getattr(theme, "gray_300", "#d1d5db"),
+        ),
     ]
 
     for ci in align_right_cols:
@@ -108,9 +209,6 @@ def make_iucn_table(
     """
     Table with IUCN category badges (colored cell background for iucn_col_idx).
     """
-    from reportlab.lib import colors
-    from reportlab.lib.units import cm
-    from reportlab.platypus import Table, TableStyle
 
     formatted = []
     for ri, row in enumerate(rows):
@@ -122,12 +220,12 @@ def make_iucn_table(
 
     t = Table(formatted, colWidths=[w * cm for w in col_widths])
     style = [
-        ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor(theme.risk)),
+        ("BACKGROUND", (0, 0), (-1, 0), hex_color(theme.risk)),
         ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
         ("FONTNAME", (0, 0), (-1, 0), theme.font_bold),
         ("FONTSIZE", (0, 0), (-1, 0), theme.table_text + 1),
-        ("ROWBACKGROUNDS", (0, 1), (-1, -1), [colors.white, colors.HexColor(theme.gray_100)]),
-        ("GRID", (0, 0), (-1, -1), 0.5, colors.HexColor(getattr(theme, "gray_300", "#d1d5db"))),
+        ("ROWBACKGROUNDS", (0, 1), (-1, -1), [colors.white, hex_color(theme.gray_100)]),
+        ("GRID", (0, 0), (-1, -1), 0.5, hex_color(getattr(theme, "gray_300", "#d1d5db"))),
         ("LEFTPADDING", (0, 0), (-1, -1), 8),
         ("RIGHTPADDING", (0, 0), (-1, -1), 8),
         ("TOPPADDING", (0, 0), (-1, -1), 5),
@@ -139,7 +237,7 @@ def make_iucn_table(
         cell_val = formatted[ri][iucn_col_idx] if iucn_col_idx < len(formatted[ri]) else ""
         if cell_val and cell_val != "—":
             bg = _iucn_badge_color(cell_val)
-            style.append(("BACKGROUND", (iucn_col_idx, ri), (iucn_col_idx, ri), colors.HexColor(bg)))
+            style.append(("BACKGROUND", (iucn_col_idx, ri), (iucn_col_idx, ri), hex_color(bg)))
             style.append(("TEXTCOLOR", (iucn_col_idx, ri), (iucn_col_idx, ri), colors.white))
     t.setStyle(TableStyle(style))
     return t
@@ -7,6 +7,7 @@ Typography, colors, spacing, grid. Single source of truth.
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -86,9 +87,9 @@ CONTENT_WIDTH_CM = 16.5
 # ─────────────────────────────────────────────────────────────────────────────
 
 
-@dataclass
+@dataclass(frozen=True)
 class Theme:
-    """Theme object passed to report builders."""
+    """Theme object passed to report builders. Frozen (hashable) so derived styles can be cached per theme."""
 
     font: str = FONT_FAMILY
     font_bold: str = FONT_BOLD
@@ -120,18 +121,24 @@ class Theme:
 
     def to_reportlab_colors(self) -> dict[str, Any]:
         """Return dict of colors for ReportLab HexColor."""
-        from reportlab.lib import colors
         return {
-            "primary": colors.HexColor(self.primary),
-            "primary_light": colors.HexColor(self.primary_light),
-            "gray_900": colors.HexColor(self.gray_900),
-            "gray_500": colors.HexColor(self.gray_500),
-            "gray_100": colors.HexColor(self.gray_100),
-            "warning": colors.HexColor(self.warning),
-            "risk": colors.HexColor(self.risk),
-            "success": colors.HexColor(self.success),
-            "white": colors.HexColor(self.white),
+            "primary": hex_color(self.primary),
+            "primary_light": hex_color(self.primary_light),
+            "gray_900": hex_color(self.gray_900),
+            "gray_500": hex_color(self.gray_500),
+            "gray_100": hex_color(self.gray_100),
+            "warning": hex_color(self.warning),
+            "risk": hex_color(self.risk),
+            "success": hex_color(self.success),
+            "white": hex_color(self.white),
         }
 
 
+@lru_cache(maxsize=64)
+def hex_color(value: str) -> Any:
+    """ReportLab colors.HexColor(value), parsed once per distinct hex string and shared."""
+    from reportlab.lib import colors
+    return colors.HexColor(value)
+
+
 DEFAULT_THEME = Theme()
@@ -57,3 +57,14 @@ def generate_report(
         gee_terrain_row=gee_terrain_row,
         industry=industry,
     )
+
+
+def prefetch_map(h3_index: str) -> None:
+    """
+    Start fetching the report map for h3_index in the background.
+    Call before slow report prep (agent call, data loads, temporal charts);
+    generate_report for the same cell then reuses the render instead of waiting on tiles.
+    """
+    from report.build_report import prefetch_map as _prefetch_map
+
+    _prefetch_map(h3_index)
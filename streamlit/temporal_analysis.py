@@ -86,31 +86,30 @@ def compute_temporal_analysis(
         )
         return result
 
-    # 1) Observation pressure
-    for _, row in hex_metrics.iterrows():
-        y = int(row["year"])
-        result["obs_by_year"][y] = _safe_int(row.get("observation_count"))
-
-    # 2) Biodiversity intensity (richness)
-    for _, row in hex_metrics.iterrows():
-        y = int(row["year"])
-        result["richness_by_year"][y] = _safe_int(row.get("species_richness_cell"))
-
-    # 3) Threatened pressure
-    for _, row in hex_metrics.iterrows():
-        y = int(row["year"])
-        result["threatened_by_year"][y] = _safe_int(row.get("n_threatened_species"))
-        result["threat_score_by_year"][y] = _safe_int(row.get("threat_score_weighted"))
+    # One positional pass over the per-year rows (itertuples, not a Series per row per metric);
+    # reindex turns absent metric columns into NaN, which the _safe_* helpers map to 0
+    metric_cols = [
+        "year", "observation_count", "species_richness_cell", "n_threatened_species",
+        "threat_score_weighted", "n_sp_cr", "n_sp_en", "n_sp_vu", "dqi",
+    ]
+    for yr, obs, richness, n_threatened, threat_score, cr, en, vu, dqi in (
+        hex_metrics.reindex(columns=metric_cols).itertuples(index=False, name=None)
+    ):
+        y = int(yr)
+        # 1) Observation pressure
+        result["obs_by_year"][y] = _safe_int(obs)
+        # 2) Biodiversity intensity (richness)
+        result["richness_by_year"][y] = _safe_int(richness)
+        # 3) Threatened pressure
+        result["threatened_by_year"][y] = _safe_int(n_threatened)
+        result["threat_score_by_year"][y] = _safe_int(threat_score)
         result["cr_en_vu_by_year"][y] = {
-            "cr": _safe_int(row.get("n_sp_cr")),
-            "en": _safe_int(row.get("n_sp_en")),
-            "vu": _safe_int(row.get("n_sp_vu")),
+            "cr": _safe_int(cr),
+            "en": _safe_int(en),
+            "vu": _safe_int(vu),
         }
-
-    # 4) DQI
-    for _, row in hex_metrics.iterrows():
-        y = int(row["year"])
-        result["dqi_by_year"][y] = _safe_float(row.get("dqi"))
+        # 4) DQI
+        result["dqi_by_year"][y] = _safe_float(dqi)
 
     # New threatened species (last 2 years vs previous 2–3 years)
     if not hex_species.empty and "is_threatened" in hex_species.columns: